@@ -1,4 +1,5 @@
 import argparse
+import functools
 from typing import Text
 
 from rasa.cli.arguments.default_arguments import (
@@ -56,6 +57,19 @@ def set_split_arguments(parser: argparse.ArgumentParser) -> None:
     )
 
 
+@functools.lru_cache()
+def split_arguments_parser() -> argparse.ArgumentParser:
+    """Returns a parent parser with the split command arguments.
+
+    The split arguments are shared by several subcommands. Building them once and
+    passing them via `parents` avoids repeating the `add_argument` calls for each
+    subcommand.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    set_split_arguments(parser)
+    return parser
+
+
 def set_validator_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--fail-on-warnings",
@@ -85,28 +85,25 @@ def _add_data_split_parsers(
     split_parser.set_defaults(func=lambda _: split_parser.print_help(None))
 
     split_subparsers = split_parser.add_subparsers()
+    split_arguments_parser = arguments.split_arguments_parser()
     nlu_split_parser = split_subparsers.add_parser(
         "nlu",
-        parents=parents,
+        parents=parents + [split_arguments_parser],
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
         help="Performs a split of your NLU data into training and test data "
         "according to the specified percentages.",
     )
     nlu_split_parser.set_defaults(func=split_nlu_data)
 
-    arguments.set_split_arguments(nlu_split_parser)
-
     stories_split_parser = split_subparsers.add_parser(
         "stories",
-        parents=parents,
+        parents=parents + [split_arguments_parser],
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
         help="Performs a split of your stories into training and test data "
         "according to the specified percentages.",
     )
     stories_split_parser.set_defaults(func=split_stories_data)
 
-    arguments.set_split_arguments(stories_split_parser)
-
 
 def _add_data_validate_parsers(
     data_subparsers: SubParsersAction, parents: List[argparse.ArgumentParser]
@@ -1,4 +1,5 @@
 import copy
+import functools
 import json
 import logging
 from typing import (
@@ -10,6 +11,7 @@ from typing import (
     TYPE_CHECKING,
     Tuple,
     Set,
+    Type,
     cast,
 )
 
@@ -21,7 +23,6 @@ from rasa.core.constants import (
     COMPRESS_ACTION_SERVER_REQUEST_ENV_NAME,
     DEFAULT_COMPRESS_ACTION_SERVER_REQUEST,
 )
-from rasa.core.policies.policy import PolicyPrediction
 from rasa.nlu.constants import (
     RESPONSE_SELECTOR_DEFAULT_INTENT,
     RESPONSE_SELECTOR_PROPERTY_NAME,
@@ -85,6 +86,8 @@ from rasa.utils.common import get_bool_env_variable
 from rasa.utils.endpoints import EndpointConfig, ClientResponseError
 
 if TYPE_CHECKING:
+    from rasa.core.actions.forms import FormAction
+    from rasa.core.policies.policy import PolicyPrediction
     from rasa.core.nlg import NaturalLanguageGenerator
     from rasa.core.channels.channel import OutputChannel
     from rasa.shared.core.events import IntentPrediction
@@ -175,7 +178,7 @@ def action_for_name_or_text(
     Returns:
         The instantiated action.
     """
-    if action_name_or_text not in domain.action_names_or_texts:
+    if action_name_or_text not in domain.action_names_or_texts_set:
         domain.raise_action_not_found_exception(action_name_or_text)
 
     defaults = {a.name(): a for a in default_actions(action_endpoint)}
@@ -264,7 +267,7 @@ class Action:
         return f"{self.__class__.__name__}('{self.name()}')"
 
     def event_for_successful_execution(
-        self, prediction: PolicyPrediction
+        self, prediction: "PolicyPrediction"
     ) -> ActionExecuted:
         """Event which should be logged for the successful execution of this action.
 
@@ -360,7 +363,7 @@ class ActionEndToEndResponse(Action):
         return [create_bot_utterance(message)]
 
     def event_for_successful_execution(
-        self, prediction: PolicyPrediction
+        self, prediction: "PolicyPrediction"
     ) -> ActionExecuted:
         """Event which should be logged for the successful execution of this action.
 
@@ -642,6 +645,21 @@ class ActionDeactivateLoop(Action):
         return [ActiveLoop(None), SlotSet(REQUESTED_SLOT, None)]
 
 
+@functools.lru_cache()
+def _action_response_validator(action_class: Type["RemoteAction"]) -> Any:
+    """Creates the validator for action server responses once per action class.
+
+    `jsonschema.validate` checks the schema and creates a new validator for every
+    response, although the schema never changes.
+    """
+    from jsonschema.validators import validator_for
+
+    schema = action_class.action_response_format_spec()
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
 class RemoteAction(Action):
     def __init__(self, name: Text, action_endpoint: Optional[EndpointConfig]) -> None:
 
@@ -697,11 +715,14 @@ class RemoteAction(Action):
         return schema
 
     def _validate_action_result(self, result: Dict[Text, Any]) -> bool:
-        from jsonschema import validate
         from jsonschema import ValidationError
+        from jsonschema.exceptions import best_match
 
         try:
-            validate(result, self.action_response_format_spec())
+            validator = _action_response_validator(type(self))
+            error = best_match(validator.iter_errors(result))
+            if error is not None:
+                raise error
             return True
         except ValidationError as e:
             e.message += (
@@ -1048,6 +1069,9 @@ class ActionExtractSlots(Action):
     def __init__(self, action_endpoint: Optional[EndpointConfig]) -> None:
         """Initializes default action extract slots."""
         self._action_endpoint = action_endpoint
+        # form actions are reused across slot mappings so that their per-domain
+        # caches (e.g. unique entity mappings) are only built once
+        self._form_actions: Dict[Text, "FormAction"] = {}
 
     def name(self) -> Text:
         """Returns action_extract_slots name."""
@@ -1062,24 +1086,25 @@ class ActionExtractSlots(Action):
         if not slot_mapping_conditions:
             return True
 
-        if (
-            tracker.is_active_loop_rejected
-            and tracker.get_slot(REQUESTED_SLOT) == slot_name
-        ):
+        # the same for all conditions, hence they are only looked up once
+        active_loop_name = tracker.active_loop_name
+        requested_slot = tracker.get_slot(REQUESTED_SLOT)
+
+        if tracker.is_active_loop_rejected and requested_slot == slot_name:
             return False
 
         # check if found mapping conditions matches form
         for condition in slot_mapping_conditions:
             active_loop = condition.get(ACTIVE_LOOP)
 
-            if active_loop and active_loop == tracker.active_loop_name:
+            if active_loop and active_loop == active_loop_name:
                 condition_requested_slot = condition.get(REQUESTED_SLOT)
                 if not condition_requested_slot:
                     return True
-                if condition_requested_slot == tracker.get_slot(REQUESTED_SLOT):
+                if condition_requested_slot == requested_slot:
                     return True
 
-            if active_loop is None and tracker.active_loop_name is None:
+            if active_loop is None and active_loop_name is None:
                 return True
 
         return False
@@ -1181,7 +1206,7 @@ class ActionExtractSlots(Action):
 
         _tracker = DialogueStateTracker.from_events(
             tracker.sender_id,
-            tracker.events_after_latest_restart() + cast(List[Event], slot_events),
+            [*tracker.events_after_latest_restart(), *slot_events],
             slots=domain.slots,
         )
         validate_events = await self._run_custom_action(
@@ -1218,7 +1243,10 @@ class ActionExtractSlots(Action):
         if tracker.get_slot(REQUESTED_SLOT) == slot_name:
             return False
 
-        form = FormAction(form_name, self._action_endpoint)
+        form = self._form_actions.get(form_name)
+        if form is None:
+            form = FormAction(form_name, self._action_endpoint)
+            self._form_actions[form_name] = form
 
         if slot_name not in form.required_slots(domain):
             return False
@@ -1242,6 +1270,11 @@ class ActionExtractSlots(Action):
         user_slots = [
             slot for slot in domain.slots if slot.name not in DEFAULT_SLOT_NAMES
         ]
+        latest_intent_name = (
+            tracker.latest_message.intent.get(INTENT_NAME_KEY)
+            if tracker.latest_message
+            else None
+        )
 
         for slot in user_slots:
             for mapping in slot.mappings:
@@ -1256,7 +1289,7 @@ class ActionExtractSlots(Action):
                     continue
 
                 intent_is_desired = SlotMapping.intent_is_desired(
-                    mapping, tracker, domain
+                    mapping, tracker, domain, latest_intent_name
                 )
 
                 if not intent_is_desired:
@@ -1,5 +1,5 @@
 import copy
-from typing import Text, List, Optional, Union, Any, Dict, Set
+from typing import Text, List, Optional, Union, Any, Dict, Set, FrozenSet
 import itertools
 import logging
 import structlog
@@ -51,9 +51,13 @@ class FormAction(LoopAction):
         self._form_name = form_name
         self.action_endpoint = action_endpoint
         # creating it requires domain, which we don't have in init
-        # we'll create it on the first call
+        # we'll create it on the first call and re-create it if the domain changes
         self._unique_entity_mappings: Set[Text] = set()
-        self._have_unique_entity_mappings_been_initialized = False
+        self._unique_entity_mappings_domain: Optional[Domain] = None
+        self._required_slot_names: FrozenSet[Text] = frozenset()
+        self._required_slot_names_domain: Optional[Domain] = None
+        self._validated_slot_mappings: Dict[Text, List[Dict[Text, Any]]] = {}
+        self._validated_slot_mappings_domain: Optional[Domain] = None
 
     def name(self) -> Text:
         """Return the form name."""
@@ -67,6 +71,14 @@ class FormAction(LoopAction):
         """
         return domain.required_slots_for_form(self.name())
 
+    def _required_slot_names_for_domain(self, domain: Domain) -> FrozenSet[Text]:
+        """Returns the required slots as a set which is cached per domain."""
+        if domain is not self._required_slot_names_domain:
+            self._required_slot_names = frozenset(self.required_slots(domain))
+            self._required_slot_names_domain = domain
+
+        return self._required_slot_names
+
     def from_entity(
         self,
         entity: Text,
@@ -107,6 +119,13 @@ class FormAction(LoopAction):
 
         If None, map requested slot to an entity with the same name
         """
+        if domain is not self._validated_slot_mappings_domain:
+            self._validated_slot_mappings = {}
+            self._validated_slot_mappings_domain = domain
+
+        if slot_to_fill in self._validated_slot_mappings:
+            return self._validated_slot_mappings[slot_to_fill]
+
         domain_slots = domain.as_dict().get(KEY_SLOTS, {})
         requested_slot_mappings = domain_slots.get(slot_to_fill, {}).get("mappings", [])
 
@@ -118,6 +137,8 @@ class FormAction(LoopAction):
             ):
                 raise TypeError("Provided incompatible slot mapping")
 
+        # the mappings only depend on the domain, so they are validated only once
+        self._validated_slot_mappings[slot_to_fill] = requested_slot_mappings
         return requested_slot_mappings
 
     def _create_unique_entity_mappings(self, domain: Domain) -> Set[Text]:
@@ -169,10 +190,10 @@ class FormAction(LoopAction):
         self, slot_mapping: Dict[Text, Any], domain: Domain
     ) -> bool:
         """Verifies if the from_entity mapping is unique."""
-        if not self._have_unique_entity_mappings_been_initialized:
-            # create unique entity mappings on the first call
+        if domain is not self._unique_entity_mappings_domain:
+            # create unique entity mappings on the first call for this domain
             self._unique_entity_mappings = self._create_unique_entity_mappings(domain)
-            self._have_unique_entity_mappings_been_initialized = True
+            self._unique_entity_mappings_domain = domain
 
         mapping_as_string = json.dumps(slot_mapping, sort_keys=True)
         return mapping_as_string in self._unique_entity_mappings
@@ -197,21 +218,24 @@ class FormAction(LoopAction):
         Returns:
             Value of entity.
         """
-        # list is used to cover the case of list slot type
-        value = list(
-            tracker.get_latest_entity_values(name, entity_group=group, entity_role=role)
+        values = tracker.get_latest_entity_values(
+            name, entity_group=group, entity_role=role
         )
 
+        # list is used to cover the case of list slot type
         if isinstance(tracker.slots.get(slot_to_be_filled), ListSlot):
-            return value
+            return list(values)
 
-        if len(value) == 0:
+        # only materialize all values if there is more than one
+        first_values = list(itertools.islice(values, 2))
+
+        if len(first_values) == 0:
             return None
 
-        if len(value) == 1:
-            return value[0]
+        if len(first_values) == 1:
+            return first_values[0]
 
-        return value
+        return first_values + list(values)
 
     def get_slot_to_fill(self, tracker: "DialogueStateTracker") -> Optional[str]:
         """Gets the name of the slot which should be filled next.
@@ -266,7 +290,7 @@ class FormAction(LoopAction):
 
         validate_name = f"validate_{self.name()}"
 
-        if validate_name not in domain.action_names_or_texts:
+        if validate_name not in domain.action_names_or_texts_set:
             return []
 
         # create temporary tracker with only the SlotSet events added
@@ -288,12 +312,16 @@ class FormAction(LoopAction):
     ) -> DialogueStateTracker:
         return DialogueStateTracker.from_events(
             current_tracker.sender_id,
-            current_tracker.events_after_latest_restart()
-            # Insert SlotSet event to make sure REQUESTED_SLOT belongs to active form.
-            + [SlotSet(REQUESTED_SLOT, self.get_slot_to_fill(current_tracker))]
-            # Insert form execution event so that it's clearly distinguishable which
-            # events were newly added.
-            + [ActionExecuted(self.name())] + additional_events,
+            [
+                *current_tracker.events_after_latest_restart(),
+                # Insert SlotSet event to make sure REQUESTED_SLOT belongs to active
+                # form.
+                SlotSet(REQUESTED_SLOT, self.get_slot_to_fill(current_tracker)),
+                # Insert form execution event so that it's clearly distinguishable
+                # which events were newly added.
+                ActionExecuted(self.name()),
+                *additional_events,
+            ],
             slots=domain.slots,
         )
 
@@ -317,11 +345,12 @@ class FormAction(LoopAction):
     ) -> List[SlotSet]:
         # TODO: Better way to get this latest_message index is through an instance
         # variable, eg. tracker.latest_message_index
+        latest_message = tracker.latest_message
         index_from_end = next(
             (
                 i
                 for i, event in enumerate(reversed(tracker.events))
-                if event == Restarted() or event == tracker.latest_message
+                if isinstance(event, Restarted) or event == latest_message
             ),
             len(tracker.events) - 1,
         )
@@ -347,31 +376,29 @@ class FormAction(LoopAction):
 
     def _add_dynamic_slots_requested_by_dynamic_forms(
         self, tracker: "DialogueStateTracker", domain: Domain
-    ) -> Set[Text]:
-        required_slots = set(self.required_slots(domain))
+    ) -> FrozenSet[Text]:
+        required_slots = self._required_slot_names_for_domain(domain)
         requested_slot = self.get_slot_to_fill(tracker)
 
-        if requested_slot:
-            required_slots.add(requested_slot)
+        if requested_slot and requested_slot not in required_slots:
+            return required_slots | {requested_slot}
 
         return required_slots
 
     def _get_slot_extractions(
         self, tracker: "DialogueStateTracker", domain: Domain
     ) -> Dict[Text, Any]:
-        events_since_last_user_uttered = FormAction._get_events_since_last_user_uttered(
-            tracker
-        )
-        slot_values: Dict[Text, Any] = {}
-
         required_slots = self._add_dynamic_slots_requested_by_dynamic_forms(
             tracker, domain
         )
+        slot_events = [
+            event
+            for event in FormAction._get_events_since_last_user_uttered(tracker)
+            if event.key in required_slots
+        ]
+        slot_values: Dict[Text, Any] = {}
 
-        for event in events_since_last_user_uttered:
-            if event.key not in required_slots:
-                continue
-
+        for event in slot_events:
             slot_values = self._update_slot_values(event, tracker, domain, slot_values)
 
         return slot_values
@@ -453,13 +480,22 @@ class FormAction(LoopAction):
             None,
         )
 
-        temp_tracker = self._temporary_tracker(tracker, events_so_far, domain)
+        # Without any new events the temporary tracker has the same slot values as
+        # the current one, so it's only needed if a slot has to be asked for.
+        temp_tracker: Optional[DialogueStateTracker] = None
+        if events_so_far:
+            temp_tracker = self._temporary_tracker(tracker, events_so_far, domain)
 
         if not slot_to_request:
-            slot_to_request = self._find_next_slot_to_request(temp_tracker, domain)
+            slot_to_request = self._find_next_slot_to_request(
+                temp_tracker or tracker, domain
+            )
             request_slot_events.append(SlotSet(REQUESTED_SLOT, slot_to_request))
 
         if slot_to_request:
+            if temp_tracker is None:
+                temp_tracker = self._temporary_tracker(tracker, events_so_far, domain)
+
             bot_message_events = await self._ask_for_slot(
                 domain, nlg, output_channel, slot_to_request, temp_tracker
             )
@@ -471,12 +507,9 @@ class FormAction(LoopAction):
     def _find_next_slot_to_request(
         self, tracker: DialogueStateTracker, domain: Domain
     ) -> Optional[Text]:
+        get_slot = tracker.get_slot
         return next(
-            (
-                slot
-                for slot in self.required_slots(domain)
-                if self._should_request_slot(tracker, slot)
-            ),
+            (slot for slot in self.required_slots(domain) if get_slot(slot) is None),
             None,
         )
 
@@ -491,7 +524,7 @@ class FormAction(LoopAction):
         found_actions = (
             action_name
             for action_name in search_path
-            if action_name in domain.action_names_or_texts
+            if action_name in domain.action_names_or_texts_set
         )
 
         return next(found_actions, None)
@@ -599,17 +632,19 @@ class FormAction(LoopAction):
             output_channel, nlg, tracker, domain
         )
 
-        events_as_str = "\n".join(str(e) for e in extraction_events)
-        logger.debug(
-            f"The execution of '{ACTION_EXTRACT_SLOTS}' resulted in "
-            f"these events: {events_as_str}."
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            events_as_str = "\n".join(str(e) for e in extraction_events)
+            logger.debug(
+                f"The execution of '{ACTION_EXTRACT_SLOTS}' resulted in "
+                f"these events: {events_as_str}."
+            )
 
         tracker.update_with_events(extraction_events, domain)
 
         for slot_name in self.required_slots(domain):
-            if not self._should_request_slot(tracker, slot_name):
-                prefilled_slots[slot_name] = tracker.get_slot(slot_name)
+            slot_value = tracker.get_slot(slot_name)
+            if slot_value is not None:
+                prefilled_slots[slot_name] = slot_value
 
         if not prefilled_slots:
             logger.debug("No pre-filled required slots to validate.")
@@ -621,7 +656,7 @@ class FormAction(LoopAction):
 
         validate_name = f"validate_{self.name()}"
 
-        if validate_name not in domain.action_names_or_texts:
+        if validate_name not in domain.action_names_or_texts_set:
             logger.debug(
                 f"There is no validation action '{validate_name}' "
                 f"to execute at form activation."
@@ -698,22 +733,30 @@ class FormAction(LoopAction):
         # We explicitly check only the last occurrences for each possible termination
         # event instead of doing `return event in events_so_far` to make it possible
         # to override termination events which were returned earlier.
-        return next(
+        last_requested_slot_event = next(
             (
                 event
                 for event in reversed(events_so_far)
                 if isinstance(event, SlotSet) and event.key == REQUESTED_SLOT
             ),
             None,
-        ) == SlotSet(REQUESTED_SLOT, None) or next(
+        )
+        if (
+            last_requested_slot_event is not None
+            and last_requested_slot_event.value is None
+        ):
+            return True
+
+        last_active_loop_event = next(
             (
                 event
                 for event in reversed(events_so_far)
                 if isinstance(event, ActiveLoop)
             ),
             None,
-        ) == ActiveLoop(
-            None
+        )
+        return (
+            last_active_loop_event is not None and last_active_loop_event.name is None
         )
 
     async def deactivate(self, *args: Any, **kwargs: Any) -> List[Event]:
@@ -1,4 +1,5 @@
 import copy
+import functools
 import re
 import logging
 import structlog
@@ -7,6 +8,9 @@ from typing import Text, Dict, Union, Any, List
 logger = logging.getLogger(__name__)
 structlogger = structlog.get_logger()
 
+# response tags "{tag_name}", blocking newlines and curly brackets in the tag name
+RESPONSE_TAG_PATTERN = re.compile(r"{([^\n{}]+?)}")
+
 
 def interpolate_text(response: Text, values: Dict[Text, Text]) -> Text:
     """Interpolate values into responses with placeholders.
@@ -25,9 +29,12 @@ def interpolate_text(response: Text, values: Dict[Text, Text]) -> Text:
     Returns:
         The piece of text with any replacements made.
     """
+    if "{" not in response and "}" not in response:
+        # there are no tags which could be replaced
+        return response
+
     try:
-        text = re.sub(r"{([^\n{}]+?)}", r"{0[\1]}", response)
-        text = text.format(values)
+        text = _as_format_string(response).format(values)
         if "0[" in text:
             # regex replaced tag but format did not replace
             # likely cause would be that tag name was enclosed
@@ -52,6 +59,16 @@ def interpolate_text(response: Text, values: Dict[Text, Text]) -> Text:
         return response
 
 
+@functools.lru_cache(maxsize=1024)
+def _as_format_string(response: Text) -> Text:
+    """Transforms the tags of a response to indices of the first format argument.
+
+    The responses are the same for every conversation, hence they are only
+    transformed once.
+    """
+    return RESPONSE_TAG_PATTERN.sub(r"{0[\1]}", response)
+
+
 def interpolate(
     response: Union[List[Any], Dict[Text, Any], Text], values: Dict[Text, Text]
 ) -> Union[List[Any], Dict[Text, Any], Text]:
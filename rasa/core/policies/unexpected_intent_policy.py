@@ -7,6 +7,7 @@ import numpy as np
 import tensorflow as tf
 
 import rasa.utils.common
+from rasa.constants import ENV_JIT_COMPILE_INFERENCE
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.recipes.default_recipe import DefaultV1Recipe
 from rasa.engine.storage.resource import Resource
@@ -324,6 +325,11 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         )
         self.ignore_intent_list = self.config[IGNORE_INTENTS_LIST]
 
+        # index lookups for the domain which was last used for prediction
+        self._indexed_domain: Optional[Domain] = None
+        self._intent_to_index: Dict[Text, int] = {}
+        self._action_unlikely_intent_index: Optional[int] = None
+
         common.mark_as_experimental_feature("UnexpecTED Intent Policy")
 
     def _standard_featurizer(self) -> IntentMaxHistoryTrackerFeaturizer:
@@ -491,6 +497,50 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         super().run_training(model_data, label_ids)
         self.compute_label_quantiles_post_training(model_data, label_ids)
 
+    def _index_domain(self, domain: Domain) -> None:
+        """Builds the index lookups for `domain` if they aren't built yet.
+
+        Args:
+            domain: Domain of the assistant.
+        """
+        if domain is self._indexed_domain:
+            return
+
+        self._intent_to_index = {
+            intent: index for index, intent in enumerate(domain.intents)
+        }
+        self._action_unlikely_intent_index = None
+        self._indexed_domain = domain
+
+    def _intent_index(self, intent: Text, domain: Domain) -> int:
+        """Looks up the index of `intent` in `domain.intents`.
+
+        Args:
+            intent: Name of the intent.
+            domain: Domain of the assistant.
+
+        Returns:
+            Index of the intent.
+        """
+        self._index_domain(domain)
+        return self._intent_to_index[intent]
+
+    def _action_unlikely_intent_index_for(self, domain: Domain) -> int:
+        """Looks up the index of `action_unlikely_intent` in `domain`.
+
+        Args:
+            domain: Domain of the assistant.
+
+        Returns:
+            Index of `action_unlikely_intent`.
+        """
+        self._index_domain(domain)
+        if self._action_unlikely_intent_index is None:
+            self._action_unlikely_intent_index = domain.index_for_action(
+                ACTION_UNLIKELY_INTENT_NAME
+            )
+        return self._action_unlikely_intent_index
+
     def _collect_action_metadata(
         self, domain: Domain, similarities: np.ndarray, query_intent: Text
     ) -> UnexpecTEDIntentPolicyMetadata:
@@ -523,7 +573,8 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         Returns:
             Metadata to be attached.
         """
-        query_intent_index = domain.intents.index(query_intent)
+        query_intent_index = self._intent_index(query_intent, domain)
+        intent_similarities = similarities[0]
 
         def _compile_metadata_for_label(
             label_name: Text, similarity_score: float, threshold: Optional[float]
@@ -538,26 +589,24 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
 
         query_intent_metadata = _compile_metadata_for_label(
             query_intent,
-            similarities[0][domain.intents.index(query_intent)],
+            intent_similarities[query_intent_index],
             self.label_thresholds.get(query_intent_index),
         )
 
-        # Ranking in descending order of predicted similarities
-        sorted_similarities = sorted(
-            [(index, similarity) for index, similarity in enumerate(similarities[0])],
-            key=lambda x: -x[1],
-        )
+        # Ranking in descending order of predicted similarities, intents with the
+        # same similarity keep their order from the domain
+        sorted_intent_indices = np.argsort(-intent_similarities, kind="stable")
 
         if self.config[RANKING_LENGTH] > 0:
-            sorted_similarities = sorted_similarities[: self.config[RANKING_LENGTH]]
+            sorted_intent_indices = sorted_intent_indices[: self.config[RANKING_LENGTH]]
 
         ranking_metadata = [
             _compile_metadata_for_label(
                 domain.intents[intent_index],
-                similarity,
+                intent_similarities[intent_index],
                 self.label_thresholds.get(intent_index),
             )
-            for intent_index, similarity in sorted_similarities
+            for intent_index in sorted_intent_indices.tolist()
         ]
 
         return UnexpecTEDIntentPolicyMetadata(query_intent_metadata, ranking_metadata)
@@ -600,6 +649,17 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
             )
             return self._prediction(self._default_predictions(domain))
 
+        last_user_uttered_event = tracker.get_last_event_for(UserUttered)
+        query_intent = (
+            last_user_uttered_event.intent_name
+            if last_user_uttered_event is not None
+            else ""
+        )
+        # The model's predictions can't make the query intent unlikely if there is no
+        # threshold for it or it is ignored, hence inference can be skipped.
+        if not self._should_check_for_intent(query_intent, domain):
+            return self._prediction(self._default_predictions(domain))
+
         # create model data from tracker
         tracker_state_features = self._featurize_for_prediction(
             tracker, domain, precomputations, rule_only_data=rule_only_data
@@ -610,19 +670,17 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
 
         # take the last prediction in the sequence
         if isinstance(output["similarities"], np.ndarray):
-            sequence_similarities = output["similarities"][:, -1, :]
+            # the similarities of the last turn are copied into a contiguous array
+            # as they are sorted and indexed repeatedly afterwards
+            sequence_similarities = np.ascontiguousarray(
+                output["similarities"][:, -1, :]
+            )
         else:
             raise TypeError(
                 "model output for `similarities` " "should be a numpy array"
             )
 
         # Check for unlikely intent
-        last_user_uttered_event = tracker.get_last_event_for(UserUttered)
-        query_intent = (
-            last_user_uttered_event.intent_name
-            if last_user_uttered_event is not None
-            else ""
-        )
         is_unlikely_intent = self._check_unlikely_intent(
             domain, sequence_similarities, query_intent
         )
@@ -630,7 +688,7 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         confidences = list(np.zeros(domain.num_actions))
 
         if is_unlikely_intent:
-            confidences[domain.index_for_action(ACTION_UNLIKELY_INTENT_NAME)] = 1.0
+            confidences[self._action_unlikely_intent_index_for(domain)] = 1.0
 
         return self._prediction(
             confidences,
@@ -687,10 +745,11 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         Returns:
             Whether intent should raise `action_unlikely_intent` or not.
         """
-        if domain.intents.index(intent) not in self.label_thresholds:
+        intent_index = self._intent_index(intent, domain)
+        if intent_index not in self.label_thresholds:
             # This means the intent was never present in a story
             logger.debug(
-                f"Query intent index {domain.intents.index(intent)} not "
+                f"Query intent index {intent_index} not "
                 f"found in label thresholds - {self.label_thresholds}. "
                 f"Check for `{ACTION_UNLIKELY_INTENT_NAME}` prediction will be skipped."
             )
@@ -728,34 +787,36 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         if not self._should_check_for_intent(query_intent, domain):
             return False
 
-        predicted_intent_scores = {
-            index: similarities[0][index] for index, intent in enumerate(domain.intents)
-        }
-        sorted_intent_scores = sorted(
-            [
-                (domain.intents[label_index], score)
-                for label_index, score in predicted_intent_scores.items()
-            ],
-            key=lambda x: x[1],
-        )
-        query_intent_id = domain.intents.index(query_intent)
-        query_intent_similarity = similarities[0][query_intent_id]
-        highest_likely_intent_id = domain.intents.index(sorted_intent_scores[-1][0])
-
-        logger.debug(
-            f"Score for intent `{query_intent}` is "
-            f"`{query_intent_similarity}`, while "
-            f"threshold is `{self.label_thresholds[query_intent_id]}`."
-        )
-        logger.debug(
-            f"Top 5 intents (in ascending order) that "
-            f"are likely here are: `{sorted_intent_scores[-5:]}`."
+        intent_similarities = similarities[0][: len(domain.intents)]
+        query_intent_id = self._intent_index(query_intent, domain)
+        query_intent_similarity = intent_similarities[query_intent_id]
+        query_intent_threshold = self.label_thresholds[query_intent_id]
+        # If several intents have the highest score, the last one of them is
+        # considered the most likely one.
+        highest_likely_intent_id = (
+            len(intent_similarities) - 1 - int(np.argmax(intent_similarities[::-1]))
         )
 
+        if logger.isEnabledFor(logging.DEBUG):
+            top_intent_ids = np.argsort(intent_similarities, kind="stable")[-5:]
+            top_intent_scores = [
+                (domain.intents[intent_id], intent_similarities[intent_id])
+                for intent_id in top_intent_ids
+            ]
+            logger.debug(
+                f"Score for intent `{query_intent}` is "
+                f"`{query_intent_similarity}`, while "
+                f"threshold is `{query_intent_threshold}`."
+            )
+            logger.debug(
+                f"Top 5 intents (in ascending order) that "
+                f"are likely here are: `{top_intent_scores}`."
+            )
+
         # If score for query intent is below threshold and
         # the query intent is not the top likely intent
         if (
-            query_intent_similarity < self.label_thresholds[query_intent_id]
+            query_intent_similarity < query_intent_threshold
             and query_intent_id != highest_likely_intent_id
         ):
             logger.debug(
@@ -768,7 +829,7 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
     @staticmethod
     def _collect_label_id_grouped_scores(
         output_scores: Dict[Text, np.ndarray], label_ids: np.ndarray
-    ) -> Dict[int, Dict[Text, List[float]]]:
+    ) -> Dict[int, Dict[Text, np.ndarray]]:
         """Collects similarities predicted for each label id.
 
         For each `label_id`, we collect similarity scores across
@@ -787,28 +848,26 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         if LABEL_PAD_ID in unique_label_ids:
             unique_label_ids.remove(LABEL_PAD_ID)
 
-        label_id_scores: Dict[int, Dict[Text, List[float]]] = {
-            label_id: {POSITIVE_SCORES_KEY: [], NEGATIVE_SCORES_KEY: []}
-            for label_id in unique_label_ids
-        }
-
-        for index, all_pos_labels in enumerate(label_ids):
-
-            for candidate_label_id in unique_label_ids:
-                if candidate_label_id in all_pos_labels:
-                    label_id_scores[candidate_label_id][POSITIVE_SCORES_KEY].append(
-                        output_scores["similarities"][index, 0, candidate_label_id]
-                    )
-                else:
-                    label_id_scores[candidate_label_id][NEGATIVE_SCORES_KEY].append(
-                        output_scores["similarities"][index, 0, candidate_label_id]
-                    )
+        similarities = output_scores["similarities"][:, 0, :]
+        # all label ids which are correct for a data point, one row per data point
+        all_pos_labels = np.reshape(label_ids, (len(label_ids), -1))
+
+        # scores are kept as arrays instead of lists of Python floats as there
+        # can be many of them and they are only consumed by numpy afterwards
+        label_id_scores: Dict[int, Dict[Text, np.ndarray]] = {}
+        for label_id in unique_label_ids:
+            is_positive = np.any(all_pos_labels == label_id, axis=-1)
+            label_similarities = similarities[:, label_id]
+            label_id_scores[label_id] = {
+                POSITIVE_SCORES_KEY: label_similarities[is_positive],
+                NEGATIVE_SCORES_KEY: label_similarities[~is_positive],
+            }
 
         return label_id_scores
 
     @staticmethod
     def _compute_label_quantiles(
-        label_id_scores: Dict[int, Dict[Text, List[float]]]
+        label_id_scores: Dict[int, Dict[Text, Union[np.ndarray, List[float]]]]
     ) -> Dict[int, List[float]]:
         """Computes multiple quantiles for each label id.
 
@@ -826,22 +885,22 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         """
         label_quantiles = {}
 
-        quantile_indices = [
-            1 - tolerance_value / 100.0 for tolerance_value in range(0, 100, 5)
-        ]
+        quantile_indices = 1 - np.arange(0, 100, 5) / 100.0
         for label_id, prediction_scores in label_id_scores.items():
             positive_scores, negative_scores = (
                 prediction_scores[POSITIVE_SCORES_KEY],
                 prediction_scores[NEGATIVE_SCORES_KEY],
             )
-            minimum_positive_score = min(positive_scores)
-            if negative_scores:
+            minimum_positive_score = float(np.min(positive_scores))
+            if len(negative_scores):
+                # all quantiles of a label are computed with a single call so that
+                # the negative scores only need to be sorted once
                 quantile_values = np.quantile(  # type: ignore[call-overload]
                     negative_scores, quantile_indices, interpolation="lower"
                 )
-                label_quantiles[label_id] = [
-                    min(minimum_positive_score, value) for value in quantile_values
-                ]
+                label_quantiles[label_id] = np.minimum(
+                    quantile_values, minimum_positive_score
+                ).tolist()
             else:
                 label_quantiles[label_id] = [minimum_positive_score] * len(
                     quantile_indices
@@ -860,19 +919,23 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         to or above the threshold.
 
         Args:
-            label_quantiles: Quantiles computed for each label id
+            label_quantiles: Quantiles computed for each label id. The same number
+                of quantiles is computed for every label id.
             tolerance: Specified tolerance value from the configuration.
 
         Returns:
             Computed thresholds
         """
-        label_thresholds = {}
-        for label_id in label_quantiles:
-            num_thresholds = len(label_quantiles[label_id])
-            label_thresholds[label_id] = label_quantiles[label_id][
-                min(int(tolerance * num_thresholds), num_thresholds - 1)
-            ]
-        return label_thresholds
+        if not label_quantiles:
+            return {}
+
+        num_thresholds = len(next(iter(label_quantiles.values())))
+        threshold_index = min(int(tolerance * num_thresholds), num_thresholds - 1)
+
+        return {
+            label_id: quantiles[threshold_index]
+            for label_id, quantiles in label_quantiles.items()
+        }
 
     def persist_model_utilities(self, model_path: Path) -> None:
         """Persists model's utility attributes like model weights, etc.
@@ -903,7 +966,9 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         loaded_label_quantiles = load_file(
             model_path / f"{cls._metadata_filename()}.label_quantiles.st"
         )
-        label_quantiles = {int(k): list(v) for k, v in loaded_label_quantiles.items()}
+        label_quantiles = {
+            int(k): v.tolist() for k, v in loaded_label_quantiles.items()
+        }
 
         model_utilties.update({"label_quantiles": label_quantiles})
         return model_utilties
@@ -974,49 +1039,53 @@ class IntentTED(TED):
 
         indices = tf.cast(label_ids[:, :, 0], tf.int32)
 
-        # Find padding indices. They should have a value equal to `LABEL_PAD_ID`
-        padding_indices = tf.where(tf.equal(indices, LABEL_PAD_ID))
-
-        # Create a tensor of values with sign opposite to `LABEL_PAD_ID` which
-        # will serve as updates to original `indices`
-        updates_to_indices = (
-            tf.ones((tf.shape(padding_indices)[0]), dtype=tf.int32) * -1 * LABEL_PAD_ID
-        )
-
-        # Add the updates tensor to indices with padding.
-        # So, effectively all indices with `LABEL_PAD_ID=-1`
-        # become 0 because updates contain 1s.
-        # This is fine because we don't change the original non-padding label
-        # indices but only make the padding indices 'compatible'
-        # for the `tf.gather` op below.
-        indices_to_gather = tf.cast(
-            tf.tensor_scatter_nd_add(indices, padding_indices, updates_to_indices),
-            tf.int32,
-        )
+        # Padding indices have a value of `LABEL_PAD_ID=-1`. Clamping all indices
+        # to be non-negative turns them into 0, which makes them 'compatible' for the
+        # `tf.gather` op below without changing the original non-padding indices.
+        indices_to_gather = tf.maximum(indices, 0)
 
         labels_embed = tf.gather(all_labels_embed, indices_to_gather)
 
         return labels_embed
 
+    def _jit_compile_predict_step(self) -> Optional[bool]:
+        """Compiles the prediction graph with XLA if enabled via environment variable.
+
+        XLA fuses the operations of the transformer layers, but it compiles the graph
+        again for every new input shape. Hence, it is only enabled on request.
+
+        Returns:
+            `True` if XLA compilation is enabled, `None` to use TensorFlow's default.
+        """
+        if rasa.utils.common.get_bool_env_variable(ENV_JIT_COMPILE_INFERENCE, False):
+            return True
+        return None
+
     def run_bulk_inference(
-        self, model_data: RasaModelData
+        self, model_data: RasaModelData, inference_batch_size: Optional[int] = None
     ) -> Dict[Text, Union[np.ndarray, Dict[Text, Any]]]:
         """Computes model's predictions for input data.
 
         Args:
             model_data: Data to be passed as input
+            inference_batch_size: Number of data points predicted at once. Defaults
+                to the first batch size used during training. Larger batches need
+                fewer model calls but more memory.
 
         Returns:
             Predictions for the input data.
         """
         self._training = False
 
-        batch_size = (
-            self.config[BATCH_SIZES]
-            if isinstance(self.config[BATCH_SIZES], int)
-            else self.config[BATCH_SIZES][0]
-        )
+        if inference_batch_size is None:
+            inference_batch_size = (
+                self.config[BATCH_SIZES]
+                if isinstance(self.config[BATCH_SIZES], int)
+                else self.config[BATCH_SIZES][0]
+            )
 
         return self.run_inference(
-            model_data, batch_size=batch_size, output_keys_expected=["similarities"]
+            model_data,
+            batch_size=inference_batch_size,
+            output_keys_expected=["similarities"],
         )
@@ -3,11 +3,15 @@ import logging
 import os
 import textwrap
 import uuid
-from functools import partial
+from collections import deque
+from collections.abc import Hashable
+from functools import lru_cache, partial
 from multiprocessing import Process
+from pathlib import Path
 from typing import (
     Any,
     Callable,
+    Collection,
     Deque,
     Dict,
     List,
@@ -16,6 +20,7 @@ from typing import (
     Tuple,
     Union,
     Set,
+    TYPE_CHECKING,
     cast,
 )
 
@@ -82,6 +87,11 @@ from rasa.shared.core.training_data.visualization import (
     visualize_neighborhood,
 )
 from rasa.core.utils import AvailableEndpoints
+from rasa.engine.caching import (
+    CACHE_SIZE_ENV,
+    DEFAULT_CACHE_SIZE_MB,
+    LocalTrainingCache,
+)
 from rasa.shared.importers.rasa import TrainingDataImporter
 from rasa.utils.common import update_sanic_log_level
 from rasa.utils.endpoints import EndpointConfig
@@ -89,6 +99,7 @@ from rasa.shared.exceptions import InvalidConfigException
 
 # noinspection PyProtectedMember
 from rasa.shared.nlu.training_data import loading
+from rasa.shared.nlu.training_data.formats.readerwriter import TrainingDataWriter
 from rasa.shared.nlu.training_data.message import Message
 
 # WARNING: This command line UI is using an external library
@@ -100,6 +111,9 @@ import rasa.utils.io as io_utils
 
 from rasa.shared.core.generator import TrackerWithCachedStates
 
+if TYPE_CHECKING:
+    from rasa.shared.nlu.training_data.training_data import TrainingData
+
 logger = logging.getLogger(__name__)
 
 PATHS = {
@@ -122,6 +136,33 @@ MAX_NUMBER_OF_TRAINING_STORIES_FOR_VISUALIZATION = 200
 
 DEFAULT_STORY_GRAPH_FILE = "story_graph.dot"
 
+TRAINING_TRACKER_EVENTS_CACHE_FILE = "interactive_training_tracker_events_{}.json"
+
+# core responds to changes of a conversation with its tracker, whose events aren't
+# needed as the tracker is retrieved again when needed
+CHANGE_RESPONSE_PARAMS = {"include_events": EventVerbosity.NONE.name}
+
+# trackers retrieved from core by endpoint url, conversation id and verbosity; the
+# entries of a conversation are dropped whenever this module changes it
+TRACKER_CACHE: Dict[Tuple[Text, Text, EventVerbosity], Dict[Text, Any]] = {}
+
+# number of changes this module made to a conversation, which tells whether a
+# tracker was retrieved before or after a change
+CONVERSATION_CHANGES: Dict[Text, int] = {}
+
+# tracker whose chat history was printed last for a conversation
+PRINTED_CHAT_HISTORIES: Dict[Text, Dict[Text, Any]] = {}
+
+# NLU data files which are loaded in the background during the session, together
+# with their modification time when the loading started
+NLU_DATA_PRELOADS: Dict[Text, Tuple[float, "asyncio.Future[TrainingData]"]] = {}
+
+# event sequences waiting to be plotted by output file and the tasks plotting them;
+# only the latest event sequences of a file are plotted, see `_plot_trackers`
+PENDING_STORY_GRAPHS: Dict[Text, List[List[Event]]] = {}
+STORY_GRAPH_REQUESTS: Dict[Text, int] = {}
+STORY_GRAPH_WRITERS: Dict[Text, "asyncio.Future[None]"] = {}
+
 
 class RestartConversation(Exception):
     """Exception used to break out the flow and restart the conversation."""
@@ -166,11 +207,15 @@ async def send_message(
         "parse_data": parse_data,
     }
 
-    return await endpoint.request(
-        json=payload,
-        method="post",
-        subpath=f"/conversations/{conversation_id}/messages",
-    )
+    try:
+        return await endpoint.request(
+            json=payload,
+            method="post",
+            subpath=f"/conversations/{conversation_id}/messages",
+            params=CHANGE_RESPONSE_PARAMS,
+        )
+    finally:
+        _invalidate_cached_trackers(conversation_id)
 
 
 async def request_prediction(
@@ -210,6 +255,51 @@ async def retrieve_tracker(
     return cast(Dict[Text, Any], result)
 
 
+async def _retrieve_cached_tracker(
+    endpoint: EndpointConfig,
+    conversation_id: Text,
+    verbosity: EventVerbosity = EventVerbosity.ALL,
+) -> Dict[Text, Any]:
+    """Retrieve a tracker from core unless it was retrieved since the last change.
+
+    Several steps of a turn need the same tracker, e.g. to print the history and to
+    validate the predicted action. All changes to the conversation are made through
+    this module, which drops the cached trackers of the conversation once they were
+    made.
+    """
+    key = (endpoint.url, conversation_id, verbosity)
+    if key in TRACKER_CACHE:
+        return TRACKER_CACHE[key]
+
+    changes = CONVERSATION_CHANGES.get(conversation_id, 0)
+    tracker = await retrieve_tracker(endpoint, conversation_id, verbosity)
+    # the conversation might have been changed while retrieving the tracker in the
+    # background, e.g. to plot it, in which case it might be outdated already
+    if CONVERSATION_CHANGES.get(conversation_id, 0) == changes:
+        TRACKER_CACHE[key] = tracker
+    return tracker
+
+
+def _invalidate_cached_trackers(conversation_id: Text) -> None:
+    """Drop the cached trackers of a conversation as it was changed.
+
+    This has to happen once the change was made, as otherwise a tracker retrieved
+    in the background might still be the one from before the change.
+    """
+    CONVERSATION_CHANGES[conversation_id] = (
+        CONVERSATION_CHANGES.get(conversation_id, 0) + 1
+    )
+    for key in [key for key in TRACKER_CACHE if key[1] == conversation_id]:
+        del TRACKER_CACHE[key]
+
+
+def _clear_cached_trackers() -> None:
+    """Drop all cached trackers, as they are outdated once the session ended."""
+    TRACKER_CACHE.clear()
+    CONVERSATION_CHANGES.clear()
+    PRINTED_CHAT_HISTORIES.clear()
+
+
 async def send_action(
     endpoint: EndpointConfig,
     conversation_id: Text,
@@ -224,7 +314,9 @@ async def send_action(
     subpath = f"/conversations/{conversation_id}/execute"
 
     try:
-        return await endpoint.request(json=payload, method="post", subpath=subpath)
+        return await endpoint.request(
+            json=payload, method="post", subpath=subpath, params=CHANGE_RESPONSE_PARAMS
+        )
     except ClientError:
         if is_new_action:
             if action_name in NEW_RESPONSES:
@@ -255,6 +347,8 @@ async def send_action(
         else:
             logger.error("failed to execute action!")
             raise
+    finally:
+        _invalidate_cached_trackers(conversation_id)
 
 
 async def send_event(
@@ -265,7 +359,12 @@ async def send_event(
     """Log an event to a conversation."""
     subpath = f"/conversations/{conversation_id}/tracker/events"
 
-    return await endpoint.request(json=evt, method="post", subpath=subpath)
+    try:
+        return await endpoint.request(
+            json=evt, method="post", subpath=subpath, params=CHANGE_RESPONSE_PARAMS
+        )
+    finally:
+        _invalidate_cached_trackers(conversation_id)
 
 
 def format_bot_output(message: BotUttered) -> Text:
@@ -308,10 +407,9 @@ def format_bot_output(message: BotUttered) -> Text:
 
 def latest_user_message(events: List[Dict[Text, Any]]) -> Optional[Dict[Text, Any]]:
     """Return most recent user message."""
-    for i, e in enumerate(reversed(events)):
-        if e.get("event") == UserUttered.type_name:
-            return e
-    return None
+    # the latest user message is usually only a few events before the end of the
+    # conversation, hence the events are searched backwards
+    return _latest_event_of_types(events, {UserUttered.type_name})
 
 
 async def _ask_questions(
@@ -337,22 +435,12 @@ def _selection_choices_from_intent_prediction(
     predictions: List[Dict[Text, Any]]
 ) -> List[Dict[Text, Any]]:
     """Given a list of ML predictions create a UI choice list."""
-    sorted_intents = sorted(
-        predictions, key=lambda k: (-k["confidence"], k[INTENT_NAME_KEY])
-    )
+    sorted_intents = sorted((-p["confidence"], p[INTENT_NAME_KEY]) for p in predictions)
 
-    choices = []
-    for p in sorted_intents:
-        name_with_confidence = (
-            f'{p.get("confidence"):03.2f} {p.get(INTENT_NAME_KEY):40}'
-        )
-        choice = {
-            INTENT_NAME_KEY: name_with_confidence,
-            "value": p.get(INTENT_NAME_KEY),
-        }
-        choices.append(choice)
-
-    return choices
+    return [
+        {INTENT_NAME_KEY: f"{-negated_confidence:03.2f} {name:40}", "value": name}
+        for negated_confidence, name in sorted_intents
+    ]
 
 
 async def _request_free_text_intent(
@@ -409,13 +497,14 @@ async def _request_fork_from_user(
     Returns the list of events that should be kept. Forking means, the
     conversation will be reset and continued from this previous point."""
 
-    tracker = await retrieve_tracker(
+    tracker = await _retrieve_cached_tracker(
         endpoint, conversation_id, EventVerbosity.AFTER_RESTART
     )
 
+    user_uttered = UserUttered.type_name
     choices = []
     for i, e in enumerate(tracker.get("events", [])):
-        if e.get("event") == UserUttered.type_name:
+        if e.get("event") == user_uttered:
             choices.append({"name": e.get("text"), "value": i})
 
     fork_idx = await _request_fork_point_from_list(
@@ -430,7 +519,7 @@ async def _request_fork_from_user(
 
 async def _request_intent_from_user(
     latest_message: Dict[Text, Any],
-    intents: List[Text],
+    intents: Collection[Text],
     conversation_id: Text,
     endpoint: EndpointConfig,
 ) -> Dict[Text, Any]:
@@ -438,13 +527,19 @@ async def _request_intent_from_user(
 
     Returns the intent dict that has been selected by the user."""
 
-    predictions = latest_message.get("parse_data", {}).get("intent_ranking", [])
+    # the message belongs to a cached tracker, hence the predictions are copied
+    # before adding the remaining intents
+    predictions = [
+        dict(p) for p in latest_message.get("parse_data", {}).get("intent_ranking", [])
+    ]
 
-    predicted_intents = {p[INTENT_NAME_KEY] for p in predictions}
+    predictions_by_name = {p[INTENT_NAME_KEY]: p for p in predictions}
 
     for i in intents:
-        if i not in predicted_intents:
-            predictions.append({INTENT_NAME_KEY: i, "confidence": 0.0})
+        if i not in predictions_by_name:
+            prediction = {INTENT_NAME_KEY: i, "confidence": 0.0}
+            predictions.append(prediction)
+            predictions_by_name[i] = prediction
 
     # convert intents to ui list and add <other> as a free text alternative
     choices = [
@@ -460,22 +555,26 @@ async def _request_intent_from_user(
         selected_intent = {INTENT_NAME_KEY: intent_name, "confidence": 1.0}
     else:
         # returns the selected intent with the original probability value
-        selected_intent = next(
-            (x for x in predictions if x[INTENT_NAME_KEY] == intent_name),
-            {INTENT_NAME_KEY: None},
-        )
+        selected_intent = predictions_by_name.get(intent_name, {INTENT_NAME_KEY: None})
 
     return selected_intent
 
 
 async def _print_history(conversation_id: Text, endpoint: EndpointConfig) -> None:
-    """Print information about the conversation for the user."""
-    tracker_dump = await retrieve_tracker(
+    """Print information about the conversation for the user.
+
+    Nothing is printed if the conversation didn't change since it was printed last.
+    """
+    tracker_dump = await _retrieve_cached_tracker(
         endpoint, conversation_id, EventVerbosity.AFTER_RESTART
     )
-    events = tracker_dump.get("events", [])
+    # the tracker is retrieved from the cache until the conversation changes,
+    # hence the same tracker means that this history was printed already
+    if PRINTED_CHAT_HISTORIES.get(conversation_id) is tracker_dump:
+        return
+    PRINTED_CHAT_HISTORIES[conversation_id] = tracker_dump
 
-    table = _chat_history_table(events)
+    table = _chat_history_table(tracker_dump.get("events", []))
     slot_strings = _slot_history(tracker_dump)
 
     print("------")
@@ -497,12 +596,6 @@ def _chat_history_table(events: List[Dict[Text, Any]]) -> Text:
     Also includes additional information, like any events and
     prediction probabilities."""
 
-    def wrap(txt: Text, max_width: int) -> Text:
-        true_wrapping_width = calc_true_wrapping_width(txt, max_width)
-        return "\n".join(
-            textwrap.wrap(txt, true_wrapping_width, replace_whitespace=False)
-        )
-
     def colored(txt: Text, color: Text) -> Text:
         return "{" + color + "}" + txt + "{/" + color + "}"
 
@@ -513,7 +606,7 @@ def _chat_history_table(events: List[Dict[Text, Any]]) -> Text:
         _md = _as_md_message(user_event.parse_data)
 
         _lines = [
-            colored(wrap(_md, max_width), "hired"),
+            colored(_wrap_text(_md, max_width), "hired"),
             f"intent: {intent_name} {_confidence:03.2f}",
         ]
         return "\n".join(_lines)
@@ -569,12 +662,13 @@ def _chat_history_table(events: List[Dict[Text, Any]]) -> Text:
             add_user_cell(table_data, msg)
 
         elif isinstance(event, BotUttered):
-            wrapped = wrap(format_bot_output(event), bot_width(table))
+            wrapped = _wrap_text(format_bot_output(event), bot_width(table))
             bot_column.append(colored(wrapped, "autoblue"))
 
         else:
-            if event.as_story_string():
-                bot_column.append(wrap(event.as_story_string(), bot_width(table)))
+            story_string = event.as_story_string()
+            if story_string:
+                bot_column.append(_wrap_text(story_string, bot_width(table)))
 
     if bot_column:
         text = "\n".join(bot_column)
@@ -589,6 +683,17 @@ def _chat_history_table(events: List[Dict[Text, Any]]) -> Text:
     return table.table
 
 
+@lru_cache(maxsize=1024)
+def _wrap_text(txt: Text, max_width: int) -> Text:
+    """Wraps a text of the chat history so that it fits into a table column.
+
+    The chat history is rendered again after every change of the conversation,
+    hence the wrapped texts of the previous messages are cached.
+    """
+    true_wrapping_width = calc_true_wrapping_width(txt, max_width)
+    return "\n".join(textwrap.wrap(txt, true_wrapping_width, replace_whitespace=False))
+
+
 def _slot_history(tracker_dump: Dict[Text, Any]) -> List[Text]:
     """Create an array of slot representations to be displayed."""
     slot_strings = []
@@ -603,9 +708,14 @@ def _slot_history(tracker_dump: Dict[Text, Any]) -> List[Text]:
 async def _retry_on_error(
     func: Callable, export_path: Text, *args: Any, **kwargs: Any
 ) -> None:
+    loop = asyncio.get_running_loop()
     while True:
         try:
-            return func(export_path, *args, **kwargs)
+            # writing the files is blocking, hence it's done in a separate thread to
+            # not block the event loop (which also serves the core server) meanwhile
+            return await loop.run_in_executor(
+                None, partial(func, export_path, *args, **kwargs)
+            )
         except OSError as e:
             answer = await questionary.confirm(
                 f"Failed to export '{export_path}': {e}. Please make sure 'rasa' "
@@ -619,15 +729,20 @@ async def _write_data_to_file(conversation_id: Text, endpoint: EndpointConfig) -
     """Write stories and nlu data to file."""
     story_path, nlu_path, domain_path = await _request_export_info()
 
-    tracker = await retrieve_tracker(endpoint, conversation_id)
+    tracker, serialised_domain = await asyncio.gather(
+        _retrieve_cached_tracker(endpoint, conversation_id), retrieve_domain(endpoint)
+    )
     events = tracker.get("events", [])
-
-    serialised_domain = await retrieve_domain(endpoint)
     domain = Domain.from_dict(serialised_domain)
+    # the messages are needed for both the NLU data and the domain
+    messages = _collect_messages(events)
+    previous_examples = await _get_preloaded_nlu_data(nlu_path)
 
     await _retry_on_error(_write_stories_to_file, story_path, events, domain)
-    await _retry_on_error(_write_nlu_to_file, nlu_path, events)
-    await _retry_on_error(_write_domain_to_file, domain_path, events, domain)
+    await _retry_on_error(
+        _write_nlu_to_file, nlu_path, events, messages, previous_examples
+    )
+    await _retry_on_error(_write_domain_to_file, domain_path, events, domain, messages)
 
     logger.info("Successfully wrote stories and NLU data")
 
@@ -669,23 +784,26 @@ async def _request_action_from_user(
 ) -> Tuple[Text, bool]:
     """Ask the user to correct an action prediction."""
 
-    await _print_history(conversation_id, endpoint)
+    # the history and the tracker with all events are retrieved concurrently
+    _, tracker = await asyncio.gather(
+        _print_history(conversation_id, endpoint),
+        _retrieve_cached_tracker(endpoint, conversation_id),
+    )
 
     choices = [
         {"name": f'{a["score"]:03.2f} {a["action"]:40}', "value": a["action"]}
         for a in predictions
     ]
 
-    tracker = await retrieve_tracker(endpoint, conversation_id)
     events = tracker.get("events", [])
 
-    session_actions_all = [a["name"] for a in _collect_actions(events)]
-    session_actions_unique = list(set(session_actions_all))
-    old_actions = [action["value"] for action in choices]
+    # deduplicate while keeping the order in which the actions were run
+    session_actions_unique = dict.fromkeys(a["name"] for a in _collect_actions(events))
+    predicted_actions = {prediction["action"] for prediction in predictions}
     new_actions = [
         {"name": action, "value": OTHER_ACTION + action}
         for action in session_actions_unique
-        if action not in old_actions
+        if action not in predicted_actions
     ]
     choices = (
         [{"name": "<create new action>", "value": NEW_ACTION}] + new_actions + choices
@@ -765,12 +883,25 @@ def _split_conversation_at_restarts(
     """Split a conversation at restart events.
 
     Returns an array of event lists, without the restart events."""
-    deserialized_events = [Event.from_parameters(event) for event in events]
-    split_events = rasa.shared.core.events.split_events(
-        deserialized_events, Restarted, include_splitting_event=False
-    )
+    restart = Restarted.type_name
+    restart_indices = [i for i, e in enumerate(events) if e.get("event") == restart]
+    # sub conversations are the events in between two restarts, the start or the
+    # end of the conversation
+    boundaries = zip([-1] + restart_indices, restart_indices + [len(events)])
+    return [events[start + 1 : end] for start, end in boundaries if end - start > 1]
+
+
+def _split_deserialised_conversation_at_restarts(
+    events: List[Dict[Text, Any]]
+) -> List[List[Event]]:
+    """Deserialise a conversation and split it at restart events.
 
-    return [[event.as_dict() for event in events] for events in split_events]
+    Returns an array of event lists, without the restart events.
+    """
+    return [
+        [Event.from_parameters(event) for event in sub_conversation]
+        for sub_conversation in _split_conversation_at_restarts(events)
+    ]
 
 
 def _collect_messages(events: List[Dict[Text, Any]]) -> List[Message]:
@@ -779,17 +910,21 @@ def _collect_messages(events: List[Dict[Text, Any]]) -> List[Message]:
 
     import rasa.shared.nlu.training_data.util as rasa_nlu_training_data_utils
 
+    user_uttered = UserUttered.type_name
+    user_utterance_reverted = UserUtteranceReverted.type_name
     messages = []
 
     for event in events:
-        if event.get("event") == UserUttered.type_name:
-            data = event.get("parse_data", {})
+        event_type = event.get("event")
+        if event_type == user_uttered:
+            # the events belong to a cached tracker, which mustn't be changed
+            data = dict(event.get("parse_data", {}))
             rasa_nlu_training_data_utils.remove_untrainable_entities_from(data)
             msg = Message.build(
                 data["text"], data["intent"][INTENT_NAME_KEY], data["entities"]
             )
             messages.append(msg)
-        elif event.get("event") == UserUtteranceReverted.type_name and messages:
+        elif event_type == user_utterance_reverted and messages:
             messages.pop()  # user corrected the nlu, remove incorrect example
 
     return messages
@@ -798,7 +933,8 @@ def _collect_messages(events: List[Dict[Text, Any]]) -> List[Message]:
 def _collect_actions(events: List[Dict[Text, Any]]) -> List[Dict[Text, Any]]:
     """Collect all the `ActionExecuted` events into a list."""
 
-    return [evt for evt in events if evt.get("event") == ActionExecuted.type_name]
+    action_executed = ActionExecuted.type_name
+    return [evt for evt in events if evt.get("event") == action_executed]
 
 
 def _write_stories_to_file(
@@ -809,7 +945,8 @@ def _write_stories_to_file(
         YAMLStoryWriter,
     )
 
-    sub_conversations = _split_conversation_at_restarts(events)
+    # the events are deserialised once and not serialised again after splitting them
+    sub_conversations = _split_deserialised_conversation_at_restarts(events)
     io_utils.create_path(export_story_path)
 
     if rasa.shared.data.is_likely_yaml_file(export_story_path):
@@ -827,10 +964,9 @@ def _write_stories_to_file(
     ) as f:
         interactive_story_counter = 1
         for conversation in sub_conversations:
-            parsed_events = rasa.shared.core.events.deserialise_events(conversation)
             tracker = DialogueStateTracker.from_events(
                 f"interactive_story_{interactive_story_counter}",
-                evts=parsed_events,
+                evts=conversation,
                 slots=domain.slots,
             )
 
@@ -858,22 +994,84 @@ def _filter_messages(msgs: List[Message]) -> List[Message]:
     return filtered_messages
 
 
-def _write_nlu_to_file(export_nlu_path: Text, events: List[Dict[Text, Any]]) -> None:
-    """Write the nlu data of the conversation_id to the file paths."""
-    from rasa.shared.nlu.training_data.training_data import TrainingData
+def _preload_nlu_data(nlu_path: Text) -> None:
+    """Start loading existing NLU data in the background.
 
-    msgs = _collect_messages(events)
-    msgs = _filter_messages(msgs)
+    Loading large NLU files can take a while, which would otherwise delay the
+    export at the end of the session.
+
+    Args:
+        nlu_path: Path of the NLU data file.
+    """
+    if nlu_path in NLU_DATA_PRELOADS or not os.path.isfile(nlu_path):
+        return
+
+    loop = asyncio.get_running_loop()
+    NLU_DATA_PRELOADS[nlu_path] = (
+        os.path.getmtime(nlu_path),
+        loop.run_in_executor(None, loading.load_data, nlu_path),
+    )
+
+
+async def _get_preloaded_nlu_data(nlu_path: Text) -> Optional["TrainingData"]:
+    """Get the NLU data which was loaded in the background.
+
+    Args:
+        nlu_path: Path of the NLU data file.
+
+    Returns:
+        The loaded NLU data or `None` if the file wasn't preloaded, couldn't be
+        loaded, or was modified after the loading started.
+    """
+    modified_at, preload = NLU_DATA_PRELOADS.pop(nlu_path, (None, None))
+    if preload is None:
+        return None
 
     # noinspection PyBroadException
     try:
-        previous_examples = loading.load_data(export_nlu_path)
+        previous_examples = await preload
     except Exception as e:
         logger.debug(
-            f"An exception occurred while trying to load the NLU data. {str(e)}"
+            f"An exception occurred while trying to preload the NLU data. {str(e)}"
         )
-        # No previous file exists, use empty training data as replacement.
-        previous_examples = TrainingData()
+        return None
+
+    if not os.path.isfile(nlu_path) or os.path.getmtime(nlu_path) != modified_at:
+        return None
+
+    return previous_examples
+
+
+def _write_nlu_to_file(
+    export_nlu_path: Text,
+    events: List[Dict[Text, Any]],
+    messages: Optional[List[Message]] = None,
+    previous_examples: Optional["TrainingData"] = None,
+) -> None:
+    """Write the nlu data of the conversation_id to the file paths.
+
+    Args:
+        export_nlu_path: Path of the NLU data file.
+        events: Events of the conversation.
+        messages: Messages collected from `events`, if they were collected already.
+        previous_examples: NLU data of `export_nlu_path`, if it was loaded already.
+    """
+    from rasa.shared.nlu.training_data.training_data import TrainingData
+
+    if messages is None:
+        messages = _collect_messages(events)
+    msgs = _filter_messages(messages)
+
+    if previous_examples is None:
+        # noinspection PyBroadException
+        try:
+            previous_examples = loading.load_data(export_nlu_path)
+        except Exception as e:
+            logger.debug(
+                f"An exception occurred while trying to load the NLU data. {str(e)}"
+            )
+            # No previous file exists, use empty training data as replacement.
+            previous_examples = TrainingData()
 
     nlu_data = previous_examples.merge(TrainingData(msgs))
 
@@ -900,45 +1098,55 @@ def _get_nlu_target_format(export_path: Text) -> Text:
     return guessed_format
 
 
-def _entities_from_messages(messages: List[Message]) -> List[Text]:
-    """Return all entities that occur in at least one of the messages."""
-    return list({e["entity"] for m in messages for e in m.data.get("entities", [])})
-
-
-def _intents_from_messages(messages: List[Message]) -> Set[Text]:
-    """Return all intents that occur in at least one of the messages."""
+def _intents_and_entities_from_messages(
+    messages: List[Message],
+) -> Tuple[Set[Text], Set[Text]]:
+    """Return all intents and entities that occur in at least one of the messages."""
+    intents: Set[Text] = set()
+    entities: Set[Text] = set()
+    for message in messages:
+        if "intent" in message.data:
+            intents.add(message.data["intent"])
+        entities.update(e["entity"] for e in message.data.get("entities", []))
 
-    # set of distinct intents
-    distinct_intents = {m.data["intent"] for m in messages if "intent" in m.data}
-
-    return distinct_intents
+    return intents, entities
 
 
 def _write_domain_to_file(
-    domain_path: Text, events: List[Dict[Text, Any]], old_domain: Domain
+    domain_path: Text,
+    events: List[Dict[Text, Any]],
+    old_domain: Domain,
+    messages: Optional[List[Message]] = None,
 ) -> None:
-    """Write an updated domain file to the file path."""
+    """Write an updated domain file to the file path.
 
+    Args:
+        domain_path: Path of the domain file.
+        events: Events of the conversation.
+        old_domain: Domain which is updated with the data of the conversation.
+        messages: Messages collected from `events`, if they were collected already.
+    """
     io_utils.create_path(domain_path)
 
-    messages = _collect_messages(events)
+    if messages is None:
+        messages = _collect_messages(events)
+    intents, entities = _intents_and_entities_from_messages(messages)
     actions = _collect_actions(events)
     responses = NEW_RESPONSES
 
     # TODO for now there is no way to distinguish between action and form
+    excluded_actions = {
+        *rasa.shared.core.constants.DEFAULT_ACTION_NAMES,
+        *old_domain.form_names,
+    }
     collected_actions = list(
-        {
-            e["name"]
-            for e in actions
-            if e["name"] not in rasa.shared.core.constants.DEFAULT_ACTION_NAMES
-            and e["name"] not in old_domain.form_names
-        }
+        dict.fromkeys(e["name"] for e in actions if e["name"] not in excluded_actions)
     )
 
     new_domain = Domain.from_dict(
         {
-            KEY_INTENTS: list(_intents_from_messages(messages)),
-            KEY_ENTITIES: _entities_from_messages(messages),
+            KEY_INTENTS: list(intents),
+            KEY_ENTITIES: list(entities),
             KEY_RESPONSES: responses,
             KEY_ACTIONS: collected_actions,
         }
@@ -952,8 +1160,12 @@ async def _predict_till_next_listen(
     conversation_id: Text,
     conversation_ids: List[Text],
     plot_file: Optional[Text],
-) -> None:
-    """Predict and validate actions until we need to wait for a user message."""
+) -> bool:
+    """Predict and validate actions until we need to wait for a user message.
+
+    Returns `True` if the bot is listening for a user message afterwards, and
+    `False` if a user message was sent already by choosing a button.
+    """
 
     listen = False
     while not listen:
@@ -961,6 +1173,13 @@ async def _predict_till_next_listen(
         if result is None:
             result = {}
 
+        if "tracker" in result:
+            # the prediction comes with the tracker it was made for, which might
+            # contain a new session, hence it's used to print the history
+            _invalidate_cached_trackers(conversation_id)
+            key = (endpoint.url, conversation_id, EventVerbosity.AFTER_RESTART)
+            TRACKER_CACHE[key] = result["tracker"]
+
         predictions = result.get("scores", [])
         if not predictions:
             raise InvalidConfigException(
@@ -970,8 +1189,12 @@ async def _predict_till_next_listen(
                 f"least one policy ({DOCS_URL_POLICIES}) included in the configuration."
             )
 
-        probabilities = [prediction["score"] for prediction in predictions]
-        pred_out = int(np.argmax(probabilities))
+        probabilities = np.fromiter(
+            (prediction["score"] for prediction in predictions),
+            dtype=float,
+            count=len(predictions),
+        )
+        pred_out = int(probabilities.argmax())
         action_name = predictions[pred_out].get("action")
         policy = result.get("policy")
         confidence = result.get("confidence")
@@ -988,9 +1211,7 @@ async def _predict_till_next_listen(
             action_name, policy, confidence, predictions, endpoint, conversation_id
         )
 
-        await _plot_trackers(conversation_ids, plot_file, endpoint)
-
-    tracker_dump = await retrieve_tracker(
+    tracker_dump = await _retrieve_cached_tracker(
         endpoint, conversation_id, EventVerbosity.AFTER_RESTART
     )
     events = tracker_dump.get("events", [])
@@ -1006,6 +1227,9 @@ async def _predict_till_next_listen(
             user_selection = await _get_button_choice(last_event)
             if user_selection != rasa.cli.utils.FREE_TEXT_INPUT_PROMPT:
                 await send_message(endpoint, conversation_id, user_selection)
+                return False
+
+    return True
 
 
 async def _get_button_choice(last_event: Dict[Text, Any]) -> Text:
@@ -1021,21 +1245,27 @@ async def _get_button_choice(last_event: Dict[Text, Any]) -> Text:
 
 async def _correct_wrong_nlu(
     corrected_nlu: Dict[Text, Any],
-    events: List[Dict[Text, Any]],
+    latest_message: Dict[Text, Any],
     endpoint: EndpointConfig,
     conversation_id: Text,
 ) -> None:
-    """A wrong NLU prediction got corrected, update core's tracker."""
+    """A wrong NLU prediction got corrected, update core's tracker.
+
+    Args:
+        corrected_nlu: Corrected parse data of the latest user message.
+        latest_message: The latest user message event of the conversation.
+        endpoint: Endpoint of core.
+        conversation_id: ID of the conversation.
+    """
     revert_latest_user_utterance = UserUtteranceReverted().as_dict()
     # `UserUtteranceReverted` also removes the `ACTION_LISTEN` event before, hence we
     # have to replay it.
     listen_for_next_message = ActionExecuted(ACTION_LISTEN_NAME).as_dict()
-    corrected_message = latest_user_message(events)
 
-    if corrected_message is None:
+    if not latest_message:
         raise Exception("Failed to correct NLU data. User message not found.")
 
-    corrected_message["parse_data"] = corrected_nlu
+    corrected_message = {**latest_message, "parse_data": corrected_nlu}
     await send_event(
         endpoint,
         conversation_id,
@@ -1057,19 +1287,21 @@ async def _correct_wrong_action(
 
 def _form_is_rejected(action_name: Text, tracker: Dict[Text, Any]) -> bool:
     """Check if the form got rejected with the most recent action name."""
-    return (
-        tracker.get(ACTIVE_LOOP, {}).get(LOOP_NAME)
-        and action_name != tracker[ACTIVE_LOOP][LOOP_NAME]
+    active_loop_name = (tracker.get(ACTIVE_LOOP) or {}).get(LOOP_NAME)
+    return bool(
+        active_loop_name
+        and action_name != active_loop_name
         and action_name != ACTION_LISTEN_NAME
     )
 
 
 def _form_is_restored(action_name: Text, tracker: Dict[Text, Any]) -> bool:
     """Check whether the form is called again after it was rejected."""
-    return (
-        tracker.get(ACTIVE_LOOP, {}).get(LOOP_REJECTED)
+    active_loop = tracker.get(ACTIVE_LOOP) or {}
+    return bool(
+        active_loop.get(LOOP_REJECTED)
         and tracker.get("latest_action_name") == ACTION_LISTEN_NAME
-        and action_name == tracker.get(ACTIVE_LOOP, {}).get(LOOP_NAME)
+        and action_name == active_loop.get(LOOP_NAME)
     )
 
 
@@ -1162,7 +1394,7 @@ async def _validate_action(
     else:
         is_new_action = False
 
-    tracker = await retrieve_tracker(
+    tracker = await _retrieve_cached_tracker(
         endpoint, conversation_id, EventVerbosity.AFTER_RESTART
     )
 
@@ -1192,18 +1424,19 @@ async def _validate_action(
 
 def _as_md_message(parse_data: Dict[Text, Any]) -> Text:
     """Display the parse data of a message in markdown format."""
-    from rasa.shared.nlu.training_data.formats.readerwriter import TrainingDataWriter
-
-    if parse_data.get("text", "").startswith(INTENT_MESSAGE_PREFIX):
-        return parse_data["text"]
+    text = parse_data.get("text") or ""
+    if text.startswith(INTENT_MESSAGE_PREFIX):
+        return text
 
     if not parse_data.get("entities"):
-        parse_data["entities"] = []
+        parse_data = {**parse_data, "entities": []}
 
     return TrainingDataWriter.generate_message(parse_data)
 
 
-def _validate_user_regex(latest_message: Dict[Text, Any], intents: List[Text]) -> bool:
+def _validate_user_regex(
+    latest_message: Dict[Text, Any], intents: Collection[Text]
+) -> bool:
     """Validate if a users message input is correct.
 
     This assumes the user entered an intent directly, e.g. using
@@ -1212,10 +1445,7 @@ def _validate_user_regex(latest_message: Dict[Text, Any], intents: List[Text]) -
     parse_data = latest_message.get("parse_data", {})
     intent = parse_data.get("intent", {}).get(INTENT_NAME_KEY)
 
-    if intent in intents:
-        return True
-    else:
-        return False
+    return intent in intents
 
 
 async def _validate_user_text(
@@ -1250,14 +1480,14 @@ async def _validate_user_text(
 
 
 async def _validate_nlu(
-    intents: List[Text], endpoint: EndpointConfig, conversation_id: Text
+    intents: Collection[Text], endpoint: EndpointConfig, conversation_id: Text
 ) -> None:
     """Validate if a user message, either text or intent is correct.
 
     If the prediction of the latest user message is incorrect,
     the tracker will be corrected with the correct intent / entities.
     """
-    tracker = await retrieve_tracker(
+    tracker = await _retrieve_cached_tracker(
         endpoint, conversation_id, EventVerbosity.AFTER_RESTART
     )
 
@@ -1275,8 +1505,6 @@ async def _validate_nlu(
         # corrected intents have confidence 1.0
         corrected_intent["confidence"] = 1.0
 
-        events = tracker.get("events", [])
-
         entities = await _correct_entities(latest_message, endpoint, conversation_id)
         corrected_nlu = {
             "intent": corrected_intent,
@@ -1284,7 +1512,9 @@ async def _validate_nlu(
             "text": latest_message.get("text"),
         }
 
-        await _correct_wrong_nlu(corrected_nlu, events, endpoint, conversation_id)
+        await _correct_wrong_nlu(
+            corrected_nlu, latest_message, endpoint, conversation_id
+        )
 
 
 async def _correct_entities(
@@ -1318,22 +1548,28 @@ def _merge_annotated_and_original_entities(
     # overwrite entities which have already been
     # annotated in the original annotation to preserve
     # additional entity parser information
+    original_entities: Dict[Tuple, Dict[Text, Any]] = {}
+    for original_entity in parse_original.get("entities", []):
+        key = _entity_annotation_key(original_entity)
+        if key is not None:
+            original_entities.setdefault(key, original_entity)
+
     entities = parse_annotated.get("entities", [])[:]
     for i, entity in enumerate(entities):
-        for original_entity in parse_original.get("entities", []):
-            if _is_same_entity_annotation(entity, original_entity):
-                entities[i] = original_entity
-                break
+        key = _entity_annotation_key(entity)
+        if key in original_entities:
+            entities[i] = original_entities[key]
     return entities
 
 
-def _is_same_entity_annotation(entity: Dict[Text, Any], other: Dict[Text, Any]) -> bool:
-    return (
-        entity["value"] == other["value"]
-        and entity["entity"] == other["entity"]
-        and entity.get("group") == other.get("group")
-        and entity.get("role") == other.get("group")
-    )
+def _entity_annotation_key(entity: Dict[Text, Any]) -> Optional[Tuple]:
+    """Get the attributes which identify an entity annotation.
+
+    Returns `None` if the entity value can't be hashed, e.g. if it's a dict.
+    """
+    if not isinstance(entity["value"], Hashable):
+        return None
+    return entity["value"], entity["entity"], entity.get("group"), entity.get("role")
 
 
 async def _enter_user_message(conversation_id: Text, endpoint: EndpointConfig) -> None:
@@ -1352,28 +1588,47 @@ async def is_listening_for_message(
     conversation_id: Text, endpoint: EndpointConfig
 ) -> bool:
     """Check if the conversation is in need for a user message."""
-    tracker = await retrieve_tracker(endpoint, conversation_id, EventVerbosity.APPLIED)
+    tracker = await _retrieve_cached_tracker(
+        endpoint, conversation_id, EventVerbosity.APPLIED
+    )
+
+    latest_event = _latest_event_of_types(
+        tracker.get("events", []), {UserUttered.type_name, ActionExecuted.type_name}
+    )
+    return (
+        latest_event is not None
+        and latest_event.get("event") == ActionExecuted.type_name
+        and latest_event.get("name") == ACTION_LISTEN_NAME
+    )
+
 
-    for i, e in enumerate(reversed(tracker.get("events", []))):
-        if e.get("event") == UserUttered.type_name:
-            return False
-        elif e.get("event") == ActionExecuted.type_name:
-            return e.get("name") == ACTION_LISTEN_NAME
-    return False
+def _latest_event_of_types(
+    events: List[Dict[Text, Any]], event_types: Set[Text]
+) -> Optional[Dict[Text, Any]]:
+    """Find the most recent event which has one of the given types.
+
+    Args:
+        events: Serialised events of a conversation.
+        event_types: Type names of the events to look for.
+
+    Returns:
+        The most recent matching event or `None` if there is none.
+    """
+    return next((e for e in reversed(events) if e.get("event") in event_types), None)
 
 
 async def _undo_latest(conversation_id: Text, endpoint: EndpointConfig) -> None:
     """Undo either the latest bot action or user message, whatever is last."""
-    tracker = await retrieve_tracker(endpoint, conversation_id, EventVerbosity.ALL)
+    tracker = await _retrieve_cached_tracker(
+        endpoint, conversation_id, EventVerbosity.ALL
+    )
 
     # Get latest `UserUtterance` or `ActionExecuted` event.
-    last_event_type = None
-    for i, e in enumerate(reversed(tracker.get("events", []))):
-        last_event_type = e.get("event")
-        if last_event_type in {ActionExecuted.type_name, UserUttered.type_name}:
-            break
-        elif last_event_type == Restarted.type_name:
-            break
+    latest_event = _latest_event_of_types(
+        tracker.get("events", []),
+        {ActionExecuted.type_name, UserUttered.type_name, Restarted.type_name},
+    )
+    last_event_type = latest_event.get("event") if latest_event else None
 
     if last_event_type == ActionExecuted.type_name:
         undo_action = ActionReverted().as_dict()
@@ -1391,15 +1646,20 @@ async def _fetch_events(
     conversation_ids: List[Union[Text, List[Event]]], endpoint: EndpointConfig
 ) -> List[List[Event]]:
     """Retrieve all event trackers from the endpoint for all conversation ids."""
+    # the trackers are retrieved concurrently, but the event sequences keep the
+    # order of the conversation ids
+    ids_to_retrieve = [c for c in conversation_ids if isinstance(c, str)]
+    trackers = await asyncio.gather(
+        *[_retrieve_cached_tracker(endpoint, c) for c in ids_to_retrieve]
+    )
+    trackers_by_id = dict(zip(ids_to_retrieve, trackers))
+
     event_sequences = []
     for conversation_id in conversation_ids:
         if isinstance(conversation_id, str):
-            tracker = await retrieve_tracker(endpoint, conversation_id)
-            events = tracker.get("events", [])
+            events = trackers_by_id[conversation_id].get("events", [])
 
-            for conversation in _split_conversation_at_restarts(events):
-                parsed_events = rasa.shared.core.events.deserialise_events(conversation)
-                event_sequences.append(parsed_events)
+            event_sequences.extend(_split_deserialised_conversation_at_restarts(events))
         else:
             event_sequences.append(conversation_id)
     return event_sequences
@@ -1417,25 +1677,79 @@ async def _plot_trackers(
     working on. If there are events that are not part of this active tracker
     yet, they can be passed as part of `unconfirmed`. They will be appended
     to the currently active conversation.
+
+    The plot is created and written in the background. If the trackers are plotted
+    again before that started, only the more recent plot is written.
     """
     if not output_file or not conversation_ids:
         # if there is no output file provided, we are going to skip plotting
         # same happens if there are no conversation ids
         return
 
+    request = STORY_GRAPH_REQUESTS[output_file] = (
+        STORY_GRAPH_REQUESTS.get(output_file, 0) + 1
+    )
     event_sequences = await _fetch_events(conversation_ids, endpoint)
+    if STORY_GRAPH_REQUESTS[output_file] != request:
+        # the trackers were plotted again while retrieving them
+        return
 
     if unconfirmed:
         event_sequences[-1].extend(unconfirmed)
 
+    PENDING_STORY_GRAPHS[output_file] = event_sequences
+    writer = STORY_GRAPH_WRITERS.get(output_file)
+    if writer is None or writer.done():
+        STORY_GRAPH_WRITERS[output_file] = asyncio.ensure_future(
+            _write_pending_story_graphs(output_file)
+        )
+
+
+async def _write_pending_story_graphs(output_file: Text) -> None:
+    """Write the story graphs of an output file until none are pending anymore.
+
+    Args:
+        output_file: File which the story graph is written to.
+    """
+    loop = asyncio.get_running_loop()
+    while output_file in PENDING_STORY_GRAPHS:
+        event_sequences = PENDING_STORY_GRAPHS.pop(output_file)
+        try:
+            # creating the graph is blocking, hence it's done in a separate thread
+            await loop.run_in_executor(
+                None, _write_story_graph, event_sequences, output_file
+            )
+        except Exception as e:
+            logger.warning(f"Failed to plot the story graph. {e}")
+
+
+async def _finish_story_graphs() -> None:
+    """Wait until the pending story graphs are written and forget about them.
+
+    Otherwise, the tasks writing them would be destroyed while pending once the
+    session ended, which might leave a partially written story graph behind.
+    """
+    writers = list(STORY_GRAPH_WRITERS.values())
+    STORY_GRAPH_WRITERS.clear()
+    # the writers log their errors themselves
+    await asyncio.gather(*writers, return_exceptions=True)
+    PENDING_STORY_GRAPHS.clear()
+    STORY_GRAPH_REQUESTS.clear()
+
+
+def _write_story_graph(event_sequences: List[List[Event]], output_file: Text) -> None:
+    """Plot the neighbourhood of the active conversation into a file.
+
+    Args:
+        event_sequences: Event sequences to plot. The last one is the active
+            conversation.
+        output_file: File which the story graph is written to.
+    """
     graph = visualize_neighborhood(
         event_sequences[-1], event_sequences, output_file=None, max_history=2
     )
 
-    from networkx.drawing.nx_pydot import write_dot
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        write_dot(graph, f)
+    rasa.shared.utils.io.write_text_file(visualization.graph_as_dot(graph), output_file)
 
 
 def _print_help(skip_visualization: bool) -> None:
@@ -1477,8 +1791,14 @@ async def record_messages(
     conversation_id: Text = DEFAULT_SENDER_ID,
     max_message_limit: Optional[int] = None,
     skip_visualization: bool = False,
+    training_data_paths: Optional[List[Text]] = None,
 ) -> None:
     """Read messages from the command line and print bot responses."""
+    # the story graph is plotted together with the next predicted action as long
+    # as the bot isn't listening, hence the confirmed actions are plotted while
+    # the user enters the next message
+    plot_task: Optional["asyncio.Future[None]"] = None
+
     try:
         try:
             domain = await retrieve_domain(endpoint)
@@ -1489,13 +1809,21 @@ async def record_messages(
             )
             return
 
-        intents = intent_names_from_domain(domain)
+        # the existing NLU data is only needed on export, but loading it can take
+        # a while for large files
+        _preload_nlu_data(PATHS["nlu"])
+
+        # the order of the intents doesn't matter, as they are listed sorted by name
+        intents = frozenset(intent_names_from_domain(domain))
 
         num_messages = 0
+        # whether the bot is listening is known after predicting its actions,
+        # otherwise (e.g. after undoing a step) it's checked on the tracker
+        is_listening: Optional[bool] = None
 
         if not skip_visualization:
             events_including_current_user_id = _get_tracker_events_to_plot(
-                domain, file_importer, conversation_id
+                domain, file_importer, conversation_id, training_data_paths
             )
 
             plot_file = DEFAULT_STORY_GRAPH_FILE
@@ -1510,16 +1838,31 @@ async def record_messages(
 
         while not utils.is_limit_reached(num_messages, max_message_limit):
             try:
-                if await is_listening_for_message(conversation_id, endpoint):
+                if is_listening is None:
+                    is_listening = await is_listening_for_message(
+                        conversation_id, endpoint
+                    )
+                # the state is unknown again if one of the next steps is interrupted
+                listening, is_listening = is_listening, None
+                if listening:
                     await _enter_user_message(conversation_id, endpoint)
+                if plot_task:
+                    plot_task, previous_plot_task = None, plot_task
+                    await previous_plot_task
+                if listening:
                     await _validate_nlu(intents, endpoint, conversation_id)
 
-                await _predict_till_next_listen(
+                is_listening = await _predict_till_next_listen(
                     endpoint,
                     conversation_id,
                     events_including_current_user_id,
                     plot_file,
                 )
+                plot_task = asyncio.ensure_future(
+                    _plot_trackers(
+                        events_including_current_user_id, plot_file, endpoint
+                    )
+                )
 
                 num_messages += 1
             except RestartConversation:
@@ -1543,8 +1886,8 @@ async def record_messages(
                 await send_event(endpoint, conversation_id, Restarted().as_dict())
 
                 if events_fork:
-                    for evt in events_fork:
-                        await send_event(endpoint, conversation_id, evt)
+                    # the kept events are replayed with a single request
+                    await send_event(endpoint, conversation_id, events_fork)
                 logger.info("Restarted conversation at fork.")
 
                 await _print_history(conversation_id, endpoint)
@@ -1552,18 +1895,34 @@ async def record_messages(
                     events_including_current_user_id, plot_file, endpoint
                 )
 
+        if plot_task:
+            plot_task, previous_plot_task = None, plot_task
+            await previous_plot_task
+
     except Abort:
         return
     except Exception:
         logger.exception("An exception occurred while recording messages.")
         raise
+    finally:
+        if plot_task:
+            # the session ended abnormally, hence the last plot isn't needed anymore
+            plot_task.cancel()
+            await asyncio.gather(plot_task, return_exceptions=True)
+        await _finish_story_graphs()
+        _clear_cached_trackers()
 
 
 def _get_tracker_events_to_plot(
-    domain: Dict[Text, Any], file_importer: TrainingDataImporter, conversation_id: Text
+    domain: Dict[Text, Any],
+    file_importer: TrainingDataImporter,
+    conversation_id: Text,
+    training_data_paths: Optional[List[Text]] = None,
 ) -> List[Union[Text, Deque[Event]]]:
-    training_trackers = _get_training_trackers(file_importer, domain)
-    number_of_trackers = len(training_trackers)
+    number_of_trackers, training_data_events = _get_training_tracker_events(
+        file_importer, domain, training_data_paths
+    )
+    events_to_plot: List[Union[Text, Deque[Event]]] = []
     if number_of_trackers > MAX_NUMBER_OF_TRAINING_STORIES_FOR_VISUALIZATION:
         rasa.shared.utils.cli.print_warning(
             f"You have {number_of_trackers} different story paths in "
@@ -1572,12 +1931,111 @@ def _get_tracker_events_to_plot(
             f"which you created during interactive learning, but not your "
             f"training stories."
         )
-        training_trackers = []
+    else:
+        events_to_plot.extend(training_data_events)
 
-    training_data_events: List[Union[Text, Deque[Event]]] = [
-        t.events for t in training_trackers
-    ]
-    return training_data_events + [conversation_id]
+    return events_to_plot + [conversation_id]
+
+
+def _get_training_tracker_events(
+    file_importer: TrainingDataImporter,
+    domain: Dict[Text, Any],
+    training_data_paths: Optional[List[Text]] = None,
+) -> Tuple[int, List[Deque[Event]]]:
+    """Gets the number of training trackers and their events.
+
+    Generating the trackers is slow, hence the events are cached on disk for the
+    training data paths of the project. They are reused as long as the training
+    files, the domain and the Rasa version stay the same. The events are only kept
+    if they are going to be visualized.
+    """
+    cache_file = _training_tracker_events_cache_file(training_data_paths)
+    fingerprint = (
+        _training_files_fingerprint(training_data_paths, domain)
+        if cache_file and training_data_paths
+        else None
+    )
+
+    if cache_file and cache_file.exists():
+        try:
+            cached = rasa.shared.utils.io.read_json_file(cache_file)
+            if cached["fingerprint"] == fingerprint:
+                return (
+                    cached["number_of_trackers"],
+                    [
+                        deque(Event.from_parameters(event) for event in events)
+                        for events in cached["events"]
+                    ],
+                )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring the cached training tracker events. Error: {e}")
+
+    training_trackers = _get_training_trackers(file_importer, domain)
+    number_of_trackers = len(training_trackers)
+    training_data_events: List[Deque[Event]] = []
+    if number_of_trackers <= MAX_NUMBER_OF_TRAINING_STORIES_FOR_VISUALIZATION:
+        training_data_events = [t.events for t in training_trackers]
+
+    if cache_file:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            rasa.shared.utils.io.dump_obj_as_json_to_file(
+                cache_file,
+                {
+                    "fingerprint": fingerprint,
+                    "number_of_trackers": number_of_trackers,
+                    "events": [
+                        [event.as_dict() for event in events]
+                        for events in training_data_events
+                    ],
+                },
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to cache the training tracker events. Error: {e}")
+
+    return number_of_trackers, training_data_events
+
+
+def _training_tracker_events_cache_file(
+    training_data_paths: Optional[List[Text]]
+) -> Optional[Path]:
+    """Returns the cache file for the training tracker events of a project.
+
+    Returns `None` if caching is turned off or the training data paths are unknown.
+    """
+    max_cache_size = float(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE_MB))
+    if max_cache_size == 0.0 or not training_data_paths:
+        return None
+
+    project_key = rasa.shared.utils.io.deep_container_fingerprint(
+        sorted(os.path.abspath(path) for path in training_data_paths)
+    )
+    cache_file = TRAINING_TRACKER_EVENTS_CACHE_FILE.format(project_key)
+    return LocalTrainingCache._get_cache_location() / cache_file
+
+
+def _training_files_fingerprint(
+    training_data_paths: List[Text], domain: Dict[Text, Any]
+) -> Text:
+    """Fingerprints the training files by their modification times and sizes.
+
+    Other than fingerprinting the stories, this doesn't require parsing them.
+
+    Args:
+        training_data_paths: Paths of the training files or directories with them.
+        domain: Domain of the model.
+
+    Returns:
+        The fingerprint of the training files, the domain and the Rasa version.
+    """
+    file_stats = []
+    for path in rasa.shared.data.get_data_files(training_data_paths, lambda _: True):
+        stat = os.stat(path)
+        file_stats.append([path, stat.st_mtime_ns, stat.st_size])
+
+    return rasa.shared.utils.io.deep_container_fingerprint(
+        [file_stats, domain, rasa.__version__]
+    )
 
 
 def _get_training_trackers(
@@ -1599,19 +2057,22 @@ def _serve_application(
     skip_visualization: bool,
     conversation_id: Text,
     port: int,
+    training_data_paths: Optional[List[Text]] = None,
 ) -> Sanic:
     """Start a core server and attach the interactive learning IO."""
     endpoint = EndpointConfig(url=DEFAULT_SERVER_FORMAT.format("http", port))
 
     async def run_interactive_io(running_app: Sanic) -> None:
         """Small wrapper to shut down the server once cmd io is done."""
-
-        await record_messages(
-            endpoint=endpoint,
-            file_importer=file_importer,
-            skip_visualization=skip_visualization,
-            conversation_id=conversation_id,
-        )
+        # reuse the same connection to the server for all requests of the session
+        async with endpoint:
+            await record_messages(
+                endpoint=endpoint,
+                file_importer=file_importer,
+                skip_visualization=skip_visualization,
+                conversation_id=conversation_id,
+                training_data_paths=training_data_paths,
+            )
 
         logger.info("Killing Sanic server now.")
 
@@ -1675,6 +2136,13 @@ def run_interactive_learning(
 
     port = server_args.get("port", DEFAULT_SERVER_PORT)
 
+    # the training files identify the project whose training tracker events are
+    # cached for the visualization
+    training_data_paths: List[Text] = []
+    for key in ["data", "stories", "domain", "config"]:
+        paths = server_args.get(key) or []
+        training_data_paths.extend([paths] if isinstance(paths, str) else paths)
+
     SAVE_IN_E2E = server_args["e2e"]
 
     if not skip_visualization:
@@ -1700,7 +2168,14 @@ def run_interactive_learning(
 
     telemetry.track_interactive_learning_start(skip_visualization, SAVE_IN_E2E)
 
-    _serve_application(app, file_importer, skip_visualization, conversation_id, port)
+    _serve_application(
+        app,
+        file_importer,
+        skip_visualization,
+        conversation_id,
+        port,
+        training_data_paths,
+    )
 
     if not skip_visualization and p is not None:
         p.terminate()
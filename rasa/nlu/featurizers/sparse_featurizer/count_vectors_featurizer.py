@@ -29,6 +29,9 @@ from rasa.shared.nlu.training_data.training_data import TrainingData
 
 BUFFER_SLOTS_PREFIX = "buf_"
 
+# numbers which are replaced with the `__NUMBER__` token
+NUMBER_PATTERN = re.compile(r"\b[0-9]+\b")
+
 logger = logging.getLogger(__name__)
 
 
@@ -255,7 +258,7 @@ class CountVectorsFeaturizer(SparseFeaturizer, GraphComponent):
             return tokens
 
         # replace all digits with NUMBER token
-        tokens = [re.sub(r"\b[0-9]+\b", "__NUMBER__", text) for text in tokens]
+        tokens = [NUMBER_PATTERN.sub("__NUMBER__", text) for text in tokens]
 
         # convert to lowercase if necessary
         if self.lowercase:
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import (
     Any,
     Dict,
+    FrozenSet,
     List,
     NoReturn,
     Optional,
@@ -915,6 +916,11 @@ class Domain:
         """Returns combination of user actions and forms."""
         return self.user_actions + self.form_names
 
+    @rasa.shared.utils.common.lazy_property
+    def action_names_or_texts_set(self) -> FrozenSet[Text]:
+        """Returns all action names or texts as a set for fast membership checks."""
+        return frozenset(self.action_names_or_texts)
+
     @rasa.shared.utils.common.lazy_property
     def num_actions(self) -> int:
         """Returns the number of available actions."""
@@ -99,31 +99,57 @@ class SlotMapping:
 
     @staticmethod
     def intent_is_desired(
-        mapping: Dict[Text, Any], tracker: "DialogueStateTracker", domain: "Domain"
+        mapping: Dict[Text, Any],
+        tracker: "DialogueStateTracker",
+        domain: "Domain",
+        intent_name: Optional[Text] = None,
     ) -> bool:
-        """Checks whether user intent matches slot mapping intent specifications."""
-        mapping_intents = SlotMapping.to_list(mapping.get(INTENT, []))
-        mapping_not_intents = SlotMapping.to_list(mapping.get(NOT_INTENT, []))
+        """Checks whether user intent matches slot mapping intent specifications.
 
-        active_loop_name = tracker.active_loop_name
-        if active_loop_name:
-            mapping_not_intents = (
-                mapping_not_intents
-                + SlotMapping._get_active_loop_ignored_intents(
-                    mapping, domain, active_loop_name
-                )
-            )
+        Args:
+            mapping: Slot mapping.
+            tracker: The tracker.
+            domain: The domain.
+            intent_name: Name of the latest user intent. Callers which check many
+                mappings for the same tracker can pass it in to avoid reading it
+                from the tracker for every mapping.
 
-        if tracker.latest_message:
+        Returns:
+            True, if the user intent matches the mapping's intent specifications.
+        """
+        if intent_name is not None:
+            intent = intent_name
+        elif tracker.latest_message:
             intent = tracker.latest_message.intent.get(INTENT_NAME_KEY)
         else:
             intent = None
 
-        intent_not_blocked = not mapping_intents and intent not in set(
-            mapping_not_intents
-        )
+        # `intent` and `not_intent` can be a single intent name or a list of them;
+        # this is checked inline instead of via `to_list` as it's called for every
+        # mapping of every slot after each user message
+        mapping_intents = mapping.get(INTENT)
+        if isinstance(mapping_intents, list):
+            if mapping_intents:
+                # `not_intent` and ignored intents are only relevant if the mapping
+                # doesn't restrict the intents explicitly
+                return intent in mapping_intents
+        elif mapping_intents is not None:
+            return intent == mapping_intents
+
+        mapping_not_intents = mapping.get(NOT_INTENT)
+        if isinstance(mapping_not_intents, list):
+            if intent in mapping_not_intents:
+                return False
+        elif mapping_not_intents is not None and intent == mapping_not_intents:
+            return False
 
-        return intent_not_blocked or intent in mapping_intents
+        active_loop_name = tracker.active_loop_name
+        if active_loop_name:
+            return intent not in SlotMapping._get_active_loop_ignored_intents(
+                mapping, domain, active_loop_name
+            )
+
+        return True
 
     # helpers
     @staticmethod
@@ -78,8 +78,9 @@ class StoryStepBuilder:
 
         if len(events) == 1:
             # If there is only one possible event, we'll keep things simple
+            event = events[0]
             for t in self.current_steps:
-                t.add_event(events[0])
+                t.add_event(event)
         else:
             # If there are multiple different events the
             # user can use the express the same thing
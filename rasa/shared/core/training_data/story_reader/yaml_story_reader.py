@@ -1,12 +1,11 @@
 import copy
-import functools
 import json
 from json import JSONDecodeError
 import logging
 import structlog
 from pathlib import Path
 import re
-from re import Match, Pattern
+from re import Match
 from typing import Dict, Text, List, Any, Optional, Union, Tuple
 
 from rasa.shared.core.domain import Domain
@@ -75,10 +74,32 @@ CORE_SCHEMA_FILE = "shared/utils/schemas/stories.yml"
 DEFAULT_VALUE_TEXT_SLOTS = "filled"
 DEFAULT_VALUE_LIST_SLOTS = [DEFAULT_VALUE_TEXT_SLOTS]
 
+# matches `TEXT`s of messages that need to be unpacked, with named groups
+REGEX_MESSAGE_PATTERN = re.compile(
+    f"^{INTENT_MESSAGE_PREFIX}"
+    f"(?P<{INTENT_NAME_KEY}>[^{{@]+)"  # "{{" is a masked "{" in an f-string
+    f"(?P<{PREDICTED_CONFIDENCE_KEY}>@[0-9.]+)?"
+    f"(?P<{ENTITIES}>{{.+}})?"  # "{{" is a masked "{" in an f-string
+    f"(?P<rest>.*)"
+)
+
 
 class YAMLStoryReader(StoryReader):
     """Class that reads Core training data and rule data in YAML format."""
 
+    def __init__(
+        self, domain: Optional[Domain] = None, source_name: Optional[Text] = None
+    ) -> None:
+        """Creates the reader.
+
+        Args:
+            domain: Domain object.
+            source_name: Name of the training data source.
+        """
+        super().__init__(domain, source_name)
+        # default values of slots which are referenced by their name only
+        self._slot_default_values: Dict[Text, Any] = {}
+
     @classmethod
     def from_reader(cls, reader: "YAMLStoryReader") -> "YAMLStoryReader":
         """Create a reader from another reader.
@@ -254,8 +275,10 @@ class YAMLStoryReader(StoryReader):
 
         self._new_part(item_name, item)
 
+        # looked up once as stories and rules can have many steps
+        parse_step = self._parse_step
         for step in steps:
-            self._parse_step(step)
+            parse_step(step)
 
         self._close_part(item)
 
@@ -275,23 +298,23 @@ class YAMLStoryReader(StoryReader):
                 f"'{RULE_SNIPPET_ACTION_NAME}'. It will be skipped.",
                 docs=self._get_docs_link(),
             )
-        elif KEY_USER_INTENT in step.keys() or KEY_USER_MESSAGE in step.keys():
+        elif KEY_USER_INTENT in step or KEY_USER_MESSAGE in step:
             self._parse_user_utterance(step)
-        elif KEY_OR in step.keys():
+        elif KEY_OR in step:
             self._parse_or_statement(step)
-        elif KEY_ACTION in step.keys():
+        elif KEY_ACTION in step:
             self._parse_action(step)
-        elif KEY_BOT_END_TO_END_MESSAGE in step.keys():
+        elif KEY_BOT_END_TO_END_MESSAGE in step:
             self._parse_bot_message(step)
-        elif KEY_CHECKPOINT in step.keys():
+        elif KEY_CHECKPOINT in step:
             self._parse_checkpoint(step)
         # This has to be after the checkpoint test as there can be a slot key within
         # a checkpoint.
-        elif KEY_SLOT_NAME in step.keys():
+        elif KEY_SLOT_NAME in step:
             self._parse_slot(step)
-        elif KEY_ACTIVE_LOOP in step.keys():
+        elif KEY_ACTIVE_LOOP in step:
             self._parse_active_loop(step[KEY_ACTIVE_LOOP])
-        elif KEY_METADATA in step.keys():
+        elif KEY_METADATA in step:
             pass
         else:
             rasa.shared.utils.io.raise_warning(
@@ -515,8 +538,16 @@ class YAMLStoryReader(StoryReader):
                 )
                 return
 
-    @functools.lru_cache()
     def _slot_default_value(self, slot_name: Text) -> Any:
+        # the default value is looked up once per slot, so that there is a single
+        # warning for slots which need a value
+        if slot_name not in self._slot_default_values:
+            self._slot_default_values[slot_name] = self._get_slot_default_value(
+                slot_name
+            )
+        return self._slot_default_values[slot_name]
+
+    def _get_slot_default_value(self, slot_name: Text) -> Any:
         if not self.domain:
             return None
 
@@ -583,21 +614,6 @@ class YAMLStoryReader(StoryReader):
 
         self._add_checkpoint(checkpoint_name, slots_dict)
 
-    @staticmethod
-    def _regex_message_pattern() -> Pattern:
-        """Builds the pattern that matches `TEXT`s of messages that need to be unpacked.
-
-        Returns:
-            pattern with named groups
-        """
-        return re.compile(
-            f"^{INTENT_MESSAGE_PREFIX}"
-            f"(?P<{INTENT_NAME_KEY}>[^{{@]+)"  # "{{" is a masked "{" in an f-string
-            f"(?P<{PREDICTED_CONFIDENCE_KEY}>@[0-9.]+)?"
-            f"(?P<{ENTITIES}>{{.+}})?"  # "{{" is a masked "{" in an f-string
-            f"(?P<rest>.*)"
-        )
-
     @staticmethod
     def unpack_regex_message(
         message: Message,
@@ -623,7 +639,7 @@ class YAMLStoryReader(StoryReader):
             return message
 
         # Try to match the pattern.
-        match = YAMLStoryReader._regex_message_pattern().match(user_text)
+        match = REGEX_MESSAGE_PATTERN.match(user_text)
 
         # If it doesn't match, then (potentially) something went wrong, because the
         # message text did start with the special prefix -- however, a user might
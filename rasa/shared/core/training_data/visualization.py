@@ -1,6 +1,7 @@
 from collections import defaultdict, deque
 
 import random
+import re
 from typing import (
     Any,
     Text,
@@ -40,6 +41,11 @@ START_NODE_ID = 0
 END_NODE_ID = -1
 TMP_NODE_ID = -2
 
+# IDs which can be used in DOT without quoting them (DOT allows more, but not all
+# parsers do, e.g. for negative numbers)
+DOT_UNQUOTED_ID_PATTERN = re.compile(r"[0-9]+|[a-zA-Z_][a-zA-Z_0-9]*")
+DOT_KEYWORDS = {"node", "edge", "graph", "digraph", "subgraph", "strict"}
+
 VISUALIZATION_TEMPLATE_PATH = "/visualization.html"
 
 
@@ -333,6 +339,58 @@ def persist_graph(graph: "networkx.Graph", output_file: Text) -> None:
     rasa.shared.utils.io.write_text_file(template, output_file)
 
 
+def graph_as_dot(graph: "networkx.MultiDiGraph") -> Text:
+    """Serialises a graph in the DOT format.
+
+    Other than `networkx.drawing.nx_pydot.write_dot` this doesn't convert the graph
+    to a `pydot` graph first.
+
+    Args:
+        graph: The graph to serialise.
+
+    Returns:
+        The graph in the DOT format.
+    """
+    lines = ["digraph  {"]
+    for default_type in ["graph", "node", "edge"]:
+        defaults = graph.graph.get(default_type)
+        if defaults:
+            lines.append(f"{default_type} [{_dot_attributes(defaults)}];")
+
+    for node, attributes in graph.nodes(data=True):
+        lines.append(_dot_statement(_dot_id(node), attributes))
+
+    for source, target, key, attributes in graph.edges(keys=True, data=True):
+        lines.append(
+            _dot_statement(
+                f"{_dot_id(source)} -> {_dot_id(target)} ",
+                {"key": key, **attributes},
+            )
+        )
+
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _dot_statement(subject: Text, attributes: Dict[Text, Any]) -> Text:
+    if not attributes:
+        return f"{subject};"
+    return f"{subject} [{_dot_attributes(attributes)}];"
+
+
+def _dot_attributes(attributes: Dict[Text, Any]) -> Text:
+    return ", ".join(f"{name}={_dot_id(value)}" for name, value in attributes.items())
+
+
+def _dot_id(value: Any) -> Text:
+    text = str(value)
+    if DOT_UNQUOTED_ID_PATTERN.fullmatch(text) and text.lower() not in DOT_KEYWORDS:
+        return text
+    # backslashes are escaped first, as escaping the quotes adds new ones
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
 def _length_of_common_action_prefix(this: List[Event], other: List[Event]) -> int:
     """Calculate number of actions that two conversations have in common."""
     num_common_actions = 0
@@ -262,9 +262,11 @@ class CombinedDataImporter(TrainingDataImporter):
     @rasa.shared.utils.common.cached_method
     def get_config(self) -> Dict:
         """Retrieves model config (see parent class for full docstring)."""
-        configs = [importer.get_config() for importer in self._importers]
+        merged_config: Dict = {}
+        for importer in self._importers:
+            merged_config.update(importer.get_config() or {})
 
-        return reduce(lambda merged, other: {**merged, **(other or {})}, configs, {})
+        return merged_config
 
     @rasa.shared.utils.common.cached_method
     def get_domain(self) -> Domain:
@@ -302,9 +304,8 @@ class CombinedDataImporter(TrainingDataImporter):
         """Retrieves NLU training data (see parent class for full docstring)."""
         nlu_data = [importer.get_nlu_data(language) for importer in self._importers]
 
-        return reduce(
-            lambda merged, other: merged.merge(other), nlu_data, TrainingData()
-        )
+        # merging copies the merged data, hence everything is merged at once
+        return TrainingData().merge(*nlu_data)
 
     @rasa.shared.utils.common.cached_method
     def get_config_file_for_auto_config(self) -> Optional[Text]:
@@ -521,9 +522,7 @@ class E2EImporter(TrainingDataImporter):
             self._additional_training_data_from_stories(),
         ]
 
-        return reduce(
-            lambda merged, other: merged.merge(other), training_datasets, TrainingData()
-        )
+        return TrainingData().merge(*training_datasets)
 
     def _additional_training_data_from_stories(self) -> TrainingData:
         stories = self.get_stories()
@@ -196,8 +196,8 @@ def replace_entities(training_example: Text) -> Text:
     Returns:
         String with removed special symbols.
     """
-    return re.sub(
-        ENTITY_REGEX, lambda m: m.groupdict()[GROUP_ENTITY_TEXT], training_example
+    return ENTITY_REGEX.sub(
+        lambda m: m.groupdict()[GROUP_ENTITY_TEXT], training_example
     )
 
 
@@ -435,12 +435,10 @@ def is_key_in_yaml(file_path: Union[Text, Path], *keys: Text) -> bool:
     Raises:
         FileNotFoundException: if the file cannot be found.
     """
+    key_prefixes = tuple(f"{key}:" for key in keys)
     try:
         with open(file_path, encoding=DEFAULT_ENCODING) as file:
-            return any(
-                any(line.lstrip().startswith(f"{key}:") for key in keys)
-                for line in file
-            )
+            return any(line.lstrip().startswith(key_prefixes) for line in file)
     except FileNotFoundError:
         raise FileNotFoundException(
             f"Failed to read file, " f"'{os.path.abspath(file_path)}' does not exist."
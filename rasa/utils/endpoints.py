@@ -4,7 +4,8 @@ import aiohttp
 import os
 from aiohttp.client_exceptions import ContentTypeError
 from sanic.request import Request
-from typing import Any, Optional, Text, Dict
+from types import TracebackType
+from typing import Any, Optional, Text, Dict, Type
 
 from rasa.shared.exceptions import FileNotFoundException
 import rasa.shared.utils.io
@@ -101,6 +102,29 @@ class EndpointConfig:
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.cafile = cafile
         self.kwargs = kwargs
+        # session which is reused for all requests while the endpoint is used as
+        # an async context manager
+        self._shared_session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "EndpointConfig":
+        """Reuses a single client session for all requests within the context.
+
+        Otherwise every request creates its own session and hence a new connection.
+        """
+        if self._shared_session is None:
+            self._shared_session = self.session()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the client session which was shared within the context."""
+        session, self._shared_session = self._shared_session, None
+        if session is not None:
+            await session.close()
 
     def session(self) -> aiohttp.ClientSession:
         """Creates and returns a configured aiohttp client session."""
@@ -170,26 +194,37 @@ class EndpointConfig:
                     f"'{os.path.abspath(self.cafile)}' does not exist."
                 ) from e
 
+        request_kwargs = dict(
+            headers=headers,
+            params=self.combine_parameters(kwargs),
+            compress=compress,
+            ssl=sslcontext,
+            **kwargs,
+        )
+
+        if self._shared_session is not None:
+            return await self._send_request(
+                self._shared_session, method, url, **request_kwargs
+            )
+
         async with self.session() as session:
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                params=self.combine_parameters(kwargs),
-                compress=compress,
-                ssl=sslcontext,
-                **kwargs,
-            ) as response:
-                if response.status >= 400:
-                    raise ClientResponseError(
-                        response.status,
-                        response.reason,
-                        await response.content.read(),
-                    )
-                try:
-                    return await response.json()
-                except ContentTypeError:
-                    return None
+            return await self._send_request(session, method, url, **request_kwargs)
+
+    @staticmethod
+    async def _send_request(
+        session: aiohttp.ClientSession, method: Text, url: Text, **kwargs: Any
+    ) -> Optional[Any]:
+        async with session.request(method, url, **kwargs) as response:
+            if response.status >= 400:
+                raise ClientResponseError(
+                    response.status,
+                    response.reason,
+                    await response.content.read(),
+                )
+            try:
+                return await response.json()
+            except ContentTypeError:
+                return None
 
     @classmethod
     def from_dict(cls, data: Dict[Text, Any]) -> "EndpointConfig":
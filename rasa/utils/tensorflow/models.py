@@ -237,6 +237,14 @@ class RasaModel(Model):
 
         return self.batch_predict(batch_in)
 
+    def _jit_compile_predict_step(self) -> Optional[bool]:
+        """Whether the prediction graph should be compiled with XLA.
+
+        Returns:
+            `None` to use TensorFlow's default. Models can override this to opt in.
+        """
+        return None
+
     @staticmethod
     def _dynamic_signature(
         batch_in: Union[Tuple[tf.Tensor, ...], Tuple[np.ndarray, ...]]
@@ -283,7 +291,9 @@ class RasaModel(Model):
 
         if self._tf_predict_step is None:
             self._tf_predict_step = tf.function(
-                self.predict_step, input_signature=self._dynamic_signature(batch_in)
+                self.predict_step,
+                input_signature=self._dynamic_signature(batch_in),
+                jit_compile=self._jit_compile_predict_step(),
             )
 
         # Once we take advantage of TF's distributed training, this is where
@@ -313,7 +323,7 @@ class RasaModel(Model):
         Returns:
             Model outputs corresponding to the inputs fed.
         """
-        outputs: Dict[Text, Union[np.ndarray, Dict[Text, Any]]] = {}
+        batch_outputs: List[Dict[Text, Union[np.ndarray, Dict[Text, Any]]]] = []
         (data_generator, _) = rasa.utils.train_utils.create_data_generators(
             model_data=model_data, batch_sizes=batch_size, epochs=1, shuffle=False
         )
@@ -333,11 +343,13 @@ class RasaModel(Model):
                         for key, output in batch_out.items()
                         if key in output_keys_expected
                     }
-                outputs = self._merge_batch_outputs(outputs, batch_out)
+                batch_outputs.append(batch_out)
             except StopIteration:
                 # Generator ran out of batches, time to finish inferencing
                 break
-        return outputs
+        # concatenate the outputs of all batches at once instead of growing the
+        # arrays batch by batch, which would copy them over and over again
+        return self._concatenate_batch_outputs(batch_outputs)
 
     @staticmethod
     def _merge_batch_outputs(
@@ -360,17 +372,44 @@ class RasaModel(Model):
         """
         if not all_outputs:
             return batch_output
-        for key, val in batch_output.items():
+        return RasaModel._concatenate_batch_outputs([all_outputs, batch_output])
+
+    @staticmethod
+    def _concatenate_batch_outputs(
+        batch_outputs: List[Dict[Text, Union[np.ndarray, Dict[Text, Any]]]]
+    ) -> Dict[Text, Union[np.ndarray, Dict[Text, Any]]]:
+        """Concatenates the outputs of multiple batches.
+
+        Function assumes that the schema of batch output remains the same,
+        i.e. keys and their value types do not change from one batch's
+        output to another.
+
+        Args:
+            batch_outputs: Outputs of all batches in the order they were predicted.
+
+        Returns:
+            Output with the outputs of all batches stacked below each other.
+        """
+        if not batch_outputs:
+            return {}
+
+        outputs = dict(batch_outputs[0])
+        if len(batch_outputs) == 1:
+            return outputs
+
+        for key, val in outputs.items():
             if isinstance(val, np.ndarray):
-                all_outputs[key] = np.concatenate(
-                    [all_outputs[key], batch_output[key]], axis=0
+                outputs[key] = np.concatenate(
+                    [batch_output[key] for batch_output in batch_outputs], axis=0
                 )
 
             elif isinstance(val, dict):
-                # recurse and merge the inner dict first
-                all_outputs[key] = RasaModel._merge_batch_outputs(all_outputs[key], val)
+                # recurse and concatenate the inner dicts first
+                outputs[key] = RasaModel._concatenate_batch_outputs(
+                    [batch_output[key] for batch_output in batch_outputs]
+                )
 
-        return all_outputs
+        return outputs
 
     @staticmethod
     def _empty_lists_to_none_in_dict(input_dict: Dict[Text, Any]) -> Dict[Text, Any]:
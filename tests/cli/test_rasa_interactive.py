@@ -187,7 +187,7 @@ def test_pass_conversation_id_to_interactive_learning(monkeypatch: MonkeyPatch):
     do_interactive_learning(args, Mock())
 
     _serve_application.assert_called_once_with(
-        ANY, ANY, True, expected_conversation_id, 5005
+        ANY, ANY, True, expected_conversation_id, 5005, ANY
     )
 
 
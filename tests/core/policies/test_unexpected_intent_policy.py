@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Optional, List, Dict, Type
+from typing import Any, Optional, List, Dict, Type
 import tensorflow as tf
 import numpy as np
 import pytest
@@ -195,18 +195,15 @@ class TestUnexpecTEDIntentPolicy(TestTEDPolicy):
         assert sorted(list(label_id_similarities.keys())) == [0, 1, 2]
 
         # Cross-check that the collected similarities are correct for each label id.
-        assert label_id_similarities[0] == {
-            POSITIVE_SCORES_KEY: [1.2],
-            NEGATIVE_SCORES_KEY: [0.5, 0.01],
-        }
-        assert label_id_similarities[1] == {
-            POSITIVE_SCORES_KEY: [0.3, 0.2],
-            NEGATIVE_SCORES_KEY: [0.1],
-        }
-        assert label_id_similarities[2] == {
-            POSITIVE_SCORES_KEY: [1.7],
-            NEGATIVE_SCORES_KEY: [0.2, 1.6],
+        expected_similarities = {
+            0: {POSITIVE_SCORES_KEY: [1.2], NEGATIVE_SCORES_KEY: [0.5, 0.01]},
+            1: {POSITIVE_SCORES_KEY: [0.3, 0.2], NEGATIVE_SCORES_KEY: [0.1]},
+            2: {POSITIVE_SCORES_KEY: [1.7], NEGATIVE_SCORES_KEY: [0.2, 1.6]},
         }
+        for label_id, expected_scores in expected_similarities.items():
+            for key, scores in expected_scores.items():
+                assert isinstance(label_id_similarities[label_id][key], np.ndarray)
+                assert label_id_similarities[label_id][key].tolist() == scores
 
     def test_label_quantiles_computation(self):
         label_id_scores = {
@@ -466,6 +463,31 @@ class TestUnexpecTEDIntentPolicy(TestTEDPolicy):
             is False
         )
 
+    def test_intent_index_is_updated_for_new_domain(
+        self, trained_policy: UnexpecTEDIntentPolicy
+    ):
+        domain = Domain.from_yaml(
+            """
+            intents:
+            - greet
+            - goodbye
+            """
+        )
+        for intent in ["greet", "goodbye"]:
+            expected_index = domain.intents.index(intent)
+            assert trained_policy._intent_index(intent, domain) == expected_index
+
+        new_domain = Domain.from_yaml(
+            """
+            intents:
+            - affirm
+            - greet
+            """
+        )
+        for intent in ["greet", "affirm"]:
+            expected_index = new_domain.intents.index(intent)
+            assert trained_policy._intent_index(intent, new_domain) == expected_index
+
     def test_no_action_unlikely_intent_prediction(
         self,
         trained_policy: UnexpecTEDIntentPolicy,
@@ -510,6 +532,35 @@ class TestUnexpecTEDIntentPolicy(TestTEDPolicy):
 
         assert prediction.probabilities == expected_probabilities
 
+    def test_skip_inference_for_intent_without_threshold(
+        self,
+        trained_policy: UnexpecTEDIntentPolicy,
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+        default_domain: Domain,
+        monkeypatch: MonkeyPatch,
+    ):
+        loaded_policy = self.persist_and_load_policy(
+            trained_policy, model_storage, resource, execution_context
+        )
+        loaded_policy.label_thresholds = {}
+
+        tracker = DialogueStateTracker(sender_id="init", slots=default_domain.slots)
+        tracker.update_with_events(
+            [UserUttered(text="hello", intent={"name": "greet"})], default_domain
+        )
+
+        def _run_inference(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("Inference should have been skipped.")
+
+        monkeypatch.setattr(loaded_policy.model, "run_inference", _run_inference)
+
+        prediction = loaded_policy.predict_action_probabilities(tracker, default_domain)
+
+        assert prediction.probabilities == [0.0] * default_domain.num_actions
+        assert prediction.action_metadata is None
+
     @pytest.mark.parametrize(
         "predicted_similarity, threshold_value, is_unlikely",
         [(1.2, 0.2, False), (0.3, -0.1, False), (-1.5, 0.03, True)],
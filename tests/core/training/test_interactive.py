@@ -26,7 +26,7 @@ from rasa.shared.constants import (
 from rasa.shared.core.constants import ACTION_LISTEN_NAME, ACTION_UNLIKELY_INTENT_NAME
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import BotUttered, ActionExecuted, UserUttered
-from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
 from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
     YAMLStoryReader,
 )
@@ -89,7 +89,7 @@ def test_intent_names_from_domain(domain_file, expected_intents):
 async def test_send_message(mock_endpoint: EndpointConfig):
     sender_id = uuid.uuid4().hex
 
-    url = f"{mock_endpoint.url}/conversations/{sender_id}/messages"
+    url = f"{mock_endpoint.url}/conversations/{sender_id}/messages?include_events=NONE"
     with aioresponses() as mocked:
         mocked.post(url, payload={})
 
@@ -196,6 +196,17 @@ def test_latest_user_message_on_no_events():
     assert m is None
 
 
+def test_latest_event_of_types():
+    tracker_dump = "data/test_trackers/tracker_moodbot.json"
+    evts = json.loads(rasa.shared.utils.io.read_file(tracker_dump)).get("events")
+
+    latest_event = interactive._latest_event_of_types(
+        evts, {UserUttered.type_name, ActionExecuted.type_name}
+    )
+    assert latest_event is evts[-1]
+    assert interactive._latest_event_of_types(evts, {"restart"}) is None
+
+
 def test_all_events_before_user_msg():
     tracker_dump = "data/test_trackers/tracker_moodbot.json"
     tracker_json = json.loads(rasa.shared.utils.io.read_file(tracker_dump))
@@ -240,6 +251,149 @@ async def test_print_history(mock_endpoint):
         assert utilities.latest_request(mocked, "get", url) is not None
 
 
+async def test_cached_tracker_is_retrieved_again_after_change(mock_endpoint):
+    tracker_dump = rasa.shared.utils.io.read_file(
+        "data/test_trackers/tracker_moodbot.json"
+    )
+
+    sender_id = uuid.uuid4().hex
+
+    url = "{}/conversations/{}/tracker?include_events=AFTER_RESTART".format(
+        mock_endpoint.url, sender_id
+    )
+    append_url = "{}/conversations/{}/tracker/events?include_events=NONE".format(
+        mock_endpoint.url, sender_id
+    )
+    with aioresponses() as mocked:
+        mocked.get(url, body=tracker_dump, repeat=True)
+        mocked.post(append_url)
+
+        await interactive._print_history(sender_id, mock_endpoint)
+        await interactive._print_history(sender_id, mock_endpoint)
+
+        assert len(utilities.latest_request(mocked, "get", url)) == 1
+
+        await interactive.send_event(
+            mock_endpoint, sender_id, ActionExecuted(ACTION_LISTEN_NAME).as_dict()
+        )
+        await interactive._print_history(sender_id, mock_endpoint)
+
+        assert len(utilities.latest_request(mocked, "get", url)) == 2
+
+
+async def test_tracker_is_not_cached_if_changed_while_retrieving(
+    mock_endpoint: EndpointConfig,
+):
+    tracker_dump = rasa.shared.utils.io.read_file(
+        "data/test_trackers/tracker_moodbot.json"
+    )
+
+    sender_id = uuid.uuid4().hex
+
+    url = "{}/conversations/{}/tracker?include_events=AFTER_RESTART".format(
+        mock_endpoint.url, sender_id
+    )
+    with aioresponses() as mocked:
+        mocked.get(
+            url,
+            body=tracker_dump,
+            repeat=True,
+            callback=lambda *args, **kwargs: interactive._invalidate_cached_trackers(
+                sender_id
+            ),
+        )
+
+        for _ in range(2):
+            await interactive._retrieve_cached_tracker(
+                mock_endpoint, sender_id, EventVerbosity.AFTER_RESTART
+            )
+
+        assert len(utilities.latest_request(mocked, "get", url)) == 2
+
+
+async def test_cached_trackers_are_dropped_once_change_was_made(
+    mock_endpoint: EndpointConfig,
+):
+    sender_id = uuid.uuid4().hex
+    append_url = "{}/conversations/{}/tracker/events?include_events=NONE".format(
+        mock_endpoint.url, sender_id
+    )
+    changes_during_request = []
+
+    with aioresponses() as mocked:
+        mocked.post(
+            append_url,
+            callback=lambda *args, **kwargs: changes_during_request.append(
+                interactive.CONVERSATION_CHANGES.get(sender_id, 0)
+            ),
+        )
+
+        await interactive.send_event(
+            mock_endpoint, sender_id, ActionExecuted(ACTION_LISTEN_NAME).as_dict()
+        )
+
+    assert changes_during_request == [0]
+    assert interactive.CONVERSATION_CHANGES[sender_id] == 1
+
+
+def test_collecting_messages_keeps_events_unchanged():
+    parse_data = {
+        "text": "in two days",
+        "intent": {"name": "inform", "confidence": 0.9},
+        "entities": [
+            {
+                "start": 3,
+                "end": 11,
+                "entity": "time",
+                "value": "in two days",
+                "extractor": "DucklingEntityExtractor",
+            }
+        ],
+    }
+    event = UserUttered(parse_data["text"], parse_data=parse_data).as_dict()
+    original_event = json.loads(json.dumps(event))
+
+    messages = interactive._collect_messages([event])
+
+    assert not messages[0].get("entities")
+    assert event == original_event
+
+
+async def test_unchanged_history_is_not_printed_again(
+    mock_endpoint: EndpointConfig, monkeypatch: MonkeyPatch
+):
+    tracker_dump = rasa.shared.utils.io.read_file(
+        "data/test_trackers/tracker_moodbot.json"
+    )
+
+    sender_id = uuid.uuid4().hex
+
+    url = "{}/conversations/{}/tracker?include_events=AFTER_RESTART".format(
+        mock_endpoint.url, sender_id
+    )
+    append_url = "{}/conversations/{}/tracker/events?include_events=NONE".format(
+        mock_endpoint.url, sender_id
+    )
+    chat_history_table = Mock(return_value="")
+    monkeypatch.setattr(interactive, "_chat_history_table", chat_history_table)
+
+    with aioresponses() as mocked:
+        mocked.get(url, body=tracker_dump, repeat=True)
+        mocked.post(append_url)
+
+        await interactive._print_history(sender_id, mock_endpoint)
+        await interactive._print_history(sender_id, mock_endpoint)
+
+        chat_history_table.assert_called_once()
+
+        await interactive.send_event(
+            mock_endpoint, sender_id, ActionExecuted(ACTION_LISTEN_NAME).as_dict()
+        )
+        await interactive._print_history(sender_id, mock_endpoint)
+
+        assert chat_history_table.call_count == 2
+
+
 async def test_is_listening_for_messages(mock_endpoint):
     tracker_dump = rasa.shared.utils.io.read_file(
         "data/test_trackers/tracker_moodbot.json"
@@ -360,8 +514,9 @@ def test_as_md_message():
                     "start": 17,
                     "end": 23,
                     "entity": "location",
-                    "value": "Berlin",
                     "role": "from",
+                    "value": "Berlin",
+                    "extractor": "DIETClassifier",
                 },
                 {
                     "start": 27,
@@ -435,6 +590,7 @@ def test_as_md_message():
                     "entity": "size",
                     "group": "1",
                     "value": "large",
+                    "extractor": "DIETClassifier",
                 },
                 {
                     "start": 8,
@@ -494,7 +650,7 @@ async def test_undo_latest_msg(mock_endpoint):
     url = "{}/conversations/{}/tracker?include_events=ALL".format(
         mock_endpoint.url, sender_id
     )
-    append_url = "{}/conversations/{}/tracker/events".format(
+    append_url = "{}/conversations/{}/tracker/events?include_events=NONE".format(
         mock_endpoint.url, sender_id
     )
     with aioresponses() as mocked:
@@ -521,7 +677,10 @@ async def test_write_stories_to_file(mock_endpoint: EndpointConfig, tmp_path):
     sender_id = uuid.uuid4().hex
 
     url = f"{mock_endpoint.url}/conversations/{sender_id}/tracker?include_events=ALL"
-    append_url = f"{mock_endpoint.url}/conversations/{sender_id}/tracker/events"
+    append_url = (
+        f"{mock_endpoint.url}/conversations/{sender_id}/tracker/events"
+        f"?include_events=NONE"
+    )
     domain_url = f"{mock_endpoint.url}/domain"
 
     target_files = [
@@ -649,6 +808,25 @@ async def test_filter_intents_before_save_nlu_file(domain_path: Text):
     assert test_msgs == interactive._filter_messages(msgs)
 
 
+async def test_preloaded_nlu_data_is_discarded_after_file_change(tmp_path: Path):
+    nlu_path = str(tmp_path / "nlu.yml")
+    rasa.shared.utils.io.write_text_file(
+        "version: '3.1'\nnlu:\n- intent: greet\n  examples: |\n    - hello\n",
+        nlu_path,
+    )
+
+    interactive._preload_nlu_data(nlu_path)
+    previous_examples = await interactive._get_preloaded_nlu_data(nlu_path)
+    assert previous_examples.intents == {"greet"}
+
+    # the preloaded data is only used once
+    assert await interactive._get_preloaded_nlu_data(nlu_path) is None
+
+    interactive._preload_nlu_data(nlu_path)
+    os.utime(nlu_path, (0, 0))
+    assert await interactive._get_preloaded_nlu_data(nlu_path) is None
+
+
 @pytest.mark.parametrize(
     "path, expected_format",
     [("bla.json", RASA), ("other.yml", RASA_YAML), ("unknown", UNK)],
@@ -699,6 +877,43 @@ async def test_initial_plotting_call(
     )
 
 
+def test_training_tracker_events_are_cached(
+    monkeypatch: MonkeyPatch, mock_file_importer: TrainingDataImporter, tmp_path: Path
+):
+    tracker = DialogueStateTracker.from_events(
+        "one", [UserUttered("hello", {"name": "greet"}), ActionExecuted("utter_greet")]
+    )
+    get_training_trackers = Mock(return_value=[tracker])
+    monkeypatch.setattr(interactive, "_get_training_trackers", get_training_trackers)
+
+    stories_file = tmp_path / "stories.yml"
+    stories_file.write_text('version: "3.1"\nstories: []\n')
+    paths = [str(tmp_path)]
+
+    expected = (1, [tracker.events])
+    for _ in range(2):
+        events = interactive._get_training_tracker_events(mock_file_importer, {}, paths)
+        assert events == expected
+    get_training_trackers.assert_called_once()
+
+    # a different domain invalidates the cached events
+    interactive._get_training_tracker_events(mock_file_importer, {"intents": []}, paths)
+    assert get_training_trackers.call_count == 2
+
+    # so does a changed training file
+    stories_file.write_text('version: "3.1"\nstories: []\nrules: []\n')
+    interactive._get_training_tracker_events(mock_file_importer, {"intents": []}, paths)
+    assert get_training_trackers.call_count == 3
+
+    # the events of another project are cached separately
+    interactive._get_training_tracker_events(
+        mock_file_importer, {"intents": []}, [str(stories_file)]
+    )
+    assert get_training_trackers.call_count == 4
+    interactive._get_training_tracker_events(mock_file_importer, {"intents": []}, paths)
+    assert get_training_trackers.call_count == 4
+
+
 async def test_not_getting_trackers_when_skipping_visualization(
     mock_endpoint: EndpointConfig, monkeypatch: MonkeyPatch
 ):
@@ -718,6 +933,23 @@ async def test_not_getting_trackers_when_skipping_visualization(
     get_trackers.assert_not_called()
 
 
+async def test_only_latest_story_graph_is_plotted(
+    mock_endpoint: EndpointConfig, monkeypatch: MonkeyPatch, tmp_path: Path
+):
+    write_story_graph = Mock()
+    monkeypatch.setattr(interactive, "_write_story_graph", write_story_graph)
+    plot_file = str(tmp_path / "story_graph.dot")
+
+    first = [[ActionExecuted("utter_greet")]]
+    latest = [[ActionExecuted("utter_goodbye")]]
+    await interactive._plot_trackers(first, plot_file, mock_endpoint)
+    await interactive._plot_trackers(latest, plot_file, mock_endpoint)
+    await interactive._finish_story_graphs()
+
+    write_story_graph.assert_called_once_with(latest, plot_file)
+    assert not interactive.STORY_GRAPH_WRITERS
+
+
 class QuestionaryConfirmMock:
     def __init__(self, tries: int) -> None:
         self.tries = tries
@@ -1099,6 +1099,10 @@ def test_is_empty():
     assert Domain.empty().is_empty()
 
 
+def test_action_names_or_texts_set(domain: Domain):
+    assert domain.action_names_or_texts_set == set(domain.action_names_or_texts)
+
+
 def test_load_intents_from_as_dict_representation():
     domain_path = "data/test_domains/default_unfeaturized_entities.yml"
     domain = Domain.load(domain_path)
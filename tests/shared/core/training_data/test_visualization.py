@@ -1,5 +1,7 @@
 from pathlib import Path
-from typing import Text
+from typing import Any, List, Text
+
+import pytest
 
 import rasa.shared.utils.io
 from rasa.shared.core.domain import Domain
@@ -188,3 +190,65 @@ def test_story_visualization_with_merging(domain: Domain):
     assert 15 < len(generated_graph.nodes()) < 33
 
     assert 20 < len(generated_graph.edges()) < 33
+
+
+def test_graph_as_dot(domain: Domain):
+    import networkx as nx
+    import pydot
+
+    import rasa.shared.core.training_data.loading as core_loading
+
+    story_steps = core_loading.load_data_from_resource(
+        "data/test_yaml_stories/stories.yml", domain
+    )
+    generated_graph = visualization.visualize_stories(
+        story_steps, domain, output_file=None, max_history=3, should_merge_nodes=True
+    )
+    generated_graph.add_node(1000, label='say "hi"\nand "bye"')
+
+    (parsed,) = pydot.graph_from_dot_data(visualization.graph_as_dot(generated_graph))
+    (expected,) = pydot.graph_from_dot_data(
+        nx.nx_pydot.to_pydot(generated_graph).to_string()
+    )
+
+    # IDs might be quoted in one of the graphs, but not in the other
+    def unquoted(value: Text) -> Text:
+        return value.strip('"')
+
+    def nodes(graph: pydot.Dot) -> List:
+        return sorted(
+            (
+                unquoted(node.get_name()),
+                sorted((k, unquoted(v)) for k, v in node.get_attributes().items()),
+            )
+            for node in graph.get_nodes()
+        )
+
+    def edges(graph: pydot.Dot) -> List:
+        return sorted(
+            (
+                unquoted(edge.get_source()),
+                unquoted(edge.get_destination()),
+                unquoted(edge.get("label") or ""),
+            )
+            for edge in graph.get_edges()
+        )
+
+    assert nodes(parsed) == nodes(expected)
+    assert edges(parsed) == edges(expected)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("utter_greet", "utter_greet"),
+        (-1, '"-1"'),
+        ("graph", '"graph"'),
+        ('say "hi"', '"say \\"hi\\""'),
+        ("one\ntwo", '"one\\ntwo"'),
+        ("C:\\temp", '"C:\\\\temp"'),
+        ('/inform{"number": "\\d+"}', '"/inform{\\"number\\": \\"\\\\d+\\"}"'),
+    ],
+)
+def test_dot_id(value: Any, expected: Text):
+    assert visualization._dot_id(value) == expected
@@ -1,7 +1,10 @@
 from pathlib import Path
 from typing import Text
+from unittest.mock import Mock
 import os
 
+from _pytest.monkeypatch import MonkeyPatch
+
 from rasa.shared.constants import (
     DEFAULT_CONFIG_PATH,
     DEFAULT_DOMAIN_PATH,
@@ -40,6 +43,22 @@ def test_rasa_file_importer(project: Text):
     assert len(nlu_data.intent_examples) == 68
 
 
+def test_rasa_file_importer_loads_domain_once(project: Text, monkeypatch: MonkeyPatch):
+    domain_path = os.path.join(project, DEFAULT_DOMAIN_PATH)
+    default_data_path = os.path.join(project, DEFAULT_DATA_PATH)
+    importer = RasaFileImporter(None, domain_path, [default_data_path])
+
+    load_domain = Mock(wraps=Domain.load)
+    monkeypatch.setattr(Domain, "load", load_domain)
+
+    domain = importer.get_domain()
+    importer.get_stories()
+    importer.get_conversation_tests()
+
+    assert importer.get_domain() is domain
+    load_domain.assert_called_once_with(domain_path)
+
+
 def test_read_conversation_tests(project: Text):
     importer = RasaFileImporter(
         training_data_paths=[str(Path(project) / DEFAULT_CONVERSATION_TEST_PATH)]
@@ -59,6 +59,20 @@ def test_merging_batch_outputs(
     test_equal_dicts(predicted_output, expected_output)
 
 
+def test_concatenating_batch_outputs():
+    batch_outputs = [
+        {"a": np.array([1, 2]), "b": {"c": np.array([3, 1])}},
+        {"a": np.array([5, 6]), "b": {"c": np.array([2, 4])}},
+        {"a": np.array([7]), "b": {"c": np.array([0])}},
+    ]
+
+    output = RasaModel._concatenate_batch_outputs(batch_outputs)
+
+    assert np.array_equal(output["a"], np.array([1, 2, 5, 6, 7]))
+    assert np.array_equal(output["b"]["c"], np.array([3, 1, 2, 4, 0]))
+    assert RasaModel._concatenate_batch_outputs([]) == {}
+
+
 @pytest.mark.parametrize(
     "batch_size, number_of_data_points, expected_number_of_batch_iterations",
     [(2, 3, 2), (1, 3, 3), (5, 3, 1)],
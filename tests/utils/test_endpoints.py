@@ -155,6 +155,27 @@ async def test_request_non_json_response():
         assert not response
 
 
+async def test_request_with_shared_session():
+    with aioresponses() as mocked:
+        endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+
+        mocked.post("https://example.com/test", payload={"ok": True}, repeat=True)
+
+        async with endpoint:
+            session = endpoint._shared_session
+            assert session is not None
+
+            assert await endpoint.request("post", subpath="test") == {"ok": True}
+            assert await endpoint.request("post", subpath="test") == {"ok": True}
+            assert endpoint._shared_session is session
+
+        assert session.closed
+        assert endpoint._shared_session is None
+
+        r = latest_request(mocked, "post", "https://example.com/test")
+        assert len(r) == 2
+
+
 @pytest.mark.parametrize(
     "filename, endpoint_type",
     [("data/test_endpoints/example_endpoints.yml", "tracker_store")],